@@ -10,16 +10,39 @@ import asyncio
 import argparse
 from pathlib import Path
 
-# Add the current directory to the path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+# Add the current directory to the path for imports (once, to keep the importer cache valid)
+_APP_DIR = str(Path(__file__).parent)
+if _APP_DIR not in sys.path:
+    sys.path.insert(0, _APP_DIR)
 
-from src.cli.commands import CLIHandler
 from src.core.config_manager import ConfigManager
 from src.utils.logging_setup import setup_logging
 
+# Argument defaults, shared by the parser and the no-argument fast path
+DEFAULT_HOST = '0.0.0.0'
+DEFAULT_PORT = 8094
+DEFAULT_CONFIG_FILE = 'config/config.yaml'
+DEFAULT_ARGS = {
+    'web': False,
+    'cli': None,
+    'host': DEFAULT_HOST,
+    'port': DEFAULT_PORT,
+    'output': None,
+    'private': False,
+    'start_seeding': False,
+    'config_file': DEFAULT_CONFIG_FILE,
+    'verbose': False,
+}
 
-def parse_arguments():
+def parse_arguments(argv=None):
     """Parse command line arguments"""
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    # The common no-argument launch (web mode with defaults) does not need a parser
+    if not argv:
+        return argparse.Namespace(**DEFAULT_ARGS)
+    
     parser = argparse.ArgumentParser(
         description="Easy Torrent Creator - Create torrents with qBittorrent (Headless/Web-focused)",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -27,6 +50,7 @@ def parse_arguments():
 Examples:
   %(prog)s                           # Start web interface (default)
   %(prog)s --cli /path/to/folder     # CLI mode - create torrent from folder
+  %(prog)s --cli /path/a /path/b     # CLI mode - create torrents for several folders
   %(prog)s --web                     # Explicitly start web interface
         """
     )
@@ -41,19 +65,20 @@ Examples:
     mode_group.add_argument(
         '--cli', 
         metavar='PATH',
-        help='CLI mode - create torrent from specified path'
+        nargs='+',
+        help='CLI mode - create torrents from one or more specified paths'
     )
     
     # Web mode options
     parser.add_argument(
         '--host',
-        default='0.0.0.0',
+        default=DEFAULT_HOST,
         help='Web server host (default: 0.0.0.0)'
     )
     parser.add_argument(
         '--port',
         type=int,
-        default=8094,
+        default=DEFAULT_PORT,
         help='Web server port (default: 8094)'
     )
     
@@ -77,7 +102,7 @@ Examples:
     # Global options
     parser.add_argument(
         '--config-file',
-        default='config/config.yaml',
+        default=DEFAULT_CONFIG_FILE,
         help='Path to configuration file'
     )
     parser.add_argument(
@@ -86,54 +111,22 @@ Examples:
         help='Enable verbose logging'
     )
     
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-async def main():
-    """Main application entry point"""
-    args = parse_arguments()
-    
-    # Setup logging
-    setup_logging(verbose=args.verbose)
-    
-    # Load configuration
-    config_manager = ConfigManager(args.config_file)
-    
+async def main(args, config_manager: ConfigManager):
+    """CLI mode entry point"""
     try:
-        if args.cli:
-            # CLI Mode
-            cli_handler = CLIHandler(config_manager)
-            await cli_handler.create_torrent(
-                source_path=args.cli,
-                output_dir=args.output,
-                private=args.private,
-                start_seeding=args.start_seeding
-            )
-        else:
-            # Default to web mode (no GUI)
-            print("❌ No mode specified. Starting web interface...")
-            print("💡 Use --cli for command line mode")
-            print("💡 Use --web to explicitly start web interface")
-            
-            # Start web mode
-            import uvicorn
-            config = config_manager.get_config()
-            
-            host = args.host if args.host != '0.0.0.0' else config.web_server.host
-            port = args.port if args.port != 8094 else config.web_server.port
-            
-            print(f"🚀 Starting web server on http://{host}:{port}")
-            print("💡 Open your browser and navigate to the URL above")
-            print("Press Ctrl+C to stop the server")
-            
-            uvicorn.run(
-                "src.web.app:app",
-                host=host,
-                port=port,
-                reload=False,
-                access_log=True
-            )
-            
+        # Imported lazily so web mode does not pay for the CLI/qBittorrent stack here
+        from src.cli.commands import CLIHandler
+        
+        cli_handler = CLIHandler(config_manager)
+        await cli_handler.create_torrents(
+            source_paths=args.cli,
+            output_dir=args.output,
+            private=args.private,
+            start_seeding=args.start_seeding
+        )
     except KeyboardInterrupt:
         print("\nOperation cancelled by user")
         sys.exit(0)
@@ -142,47 +135,60 @@ async def main():
         sys.exit(1)
 
 
+def _run_web(args, config_manager: ConfigManager):
+    """Start the web interface, importing uvicorn only when it is needed"""
+    try:
+        import uvicorn
+        
+        config = config_manager.get_config()
+        
+        # Use config values, but allow command line overrides
+        host = args.host if args.host != DEFAULT_HOST else config.web_server.host
+        port = args.port if args.port != DEFAULT_PORT else config.web_server.port
+        
+        print(f"🚀 Starting web server on http://{host}:{port}")
+        print("💡 Open your browser and navigate to the URL above")
+        print("Press Ctrl+C to stop the server")
+        
+        uvicorn.run(
+            "src.web.app:app",
+            host=host,
+            port=port,
+            reload=False,
+            access_log=True
+        )
+    except ImportError as e:
+        print(f"❌ Web mode not available: {e}")
+        print("💡 Install web dependencies: pip install fastapi uvicorn jinja2")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print("\nWeb server stopped")
+    except Exception as e:
+        print(f"Error starting web server: {e}")
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     if sys.platform == "win32":
         # Windows specific event loop policy
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+    else:
+        # Use uvloop for faster asyncio networking when it is installed
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            pass
     
+    # Parse arguments and load configuration exactly once for either mode
     args = parse_arguments()
+    setup_logging(verbose=args.verbose)
+    config_manager = ConfigManager(args.config_file)
     
     # Handle web mode specially since uvicorn manages its own event loop
     if args.web or (not args.cli):
         # Web mode (explicit or default)
-        try:
-            import uvicorn
-            
-            setup_logging(verbose=args.verbose)
-            config_manager = ConfigManager(args.config_file)
-            config = config_manager.get_config()
-            
-            # Use config values, but allow command line overrides
-            host = args.host if args.host != '0.0.0.0' else config.web_server.host
-            port = args.port if args.port != 8094 else config.web_server.port
-            
-            print(f"🚀 Starting web server on http://{host}:{port}")
-            print("💡 Open your browser and navigate to the URL above")
-            print("Press Ctrl+C to stop the server")
-            
-            uvicorn.run(
-                "src.web.app:app",
-                host=host,
-                port=port,
-                reload=False,
-                access_log=True
-            )
-        except ImportError as e:
-            print(f"❌ Web mode not available: {e}")
-            print("💡 Install web dependencies: pip install fastapi uvicorn jinja2")
-            sys.exit(1)
-        except KeyboardInterrupt:
-            print("\nWeb server stopped")
-        except Exception as e:
-            print(f"Error starting web server: {e}")
-            sys.exit(1)
+        _run_web(args, config_manager)
     else:
         # CLI mode - use asyncio
-        asyncio.run(main())
+        asyncio.run(main(args, config_manager))
@@ -2,12 +2,18 @@
 Command Line Interface for Easy Torrent Creator
 """
 import asyncio
+import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from ..core.config_manager import ConfigManager
 from ..core.torrent_manager import TorrentManager
-from ..utils.file_utils import validate_folder_for_torrent, format_file_size, get_folder_info
+from ..utils.file_utils import validate_folder_for_torrent, format_file_size, get_folder_info, ensure_directory
+
+
+def _write_lines(lines: List[str]):
+    """Write a block of output lines with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 class CLIHandler:
@@ -33,91 +39,142 @@ class CLIHandler:
             private: Whether to create private torrent
             start_seeding: Whether to start seeding immediately
         """
+        await self.create_torrents([source_path], output_dir, private, start_seeding)
+    
+    async def create_torrents(
+        self,
+        source_paths: List[str],
+        output_dir: Optional[str] = None,
+        private: bool = True,
+        start_seeding: bool = False
+    ):
+        """
+        Create torrents for several sources over a single qBittorrent connection
+        
+        Args:
+            source_paths: Paths to folders/files to create torrents from
+            output_dir: Output directory (uses config default if None)
+            private: Whether to create private torrents
+            start_seeding: Whether to start seeding immediately
+        """
         try:
-            # Validate source path
-            source = Path(source_path)
-            if not source.exists():
-                print(f"❌ Error: Source path does not exist: {source_path}")
-                return
-            
-            # Validate source for torrent creation
-            is_valid, message = validate_folder_for_torrent(source)
-            if not is_valid:
-                print(f"❌ Error: {message}")
+            existing = []
+            for path in source_paths:
+                if Path(path).exists():
+                    existing.append(path)
+                else:
+                    print(f"❌ Error: Source path does not exist: {path}")
+            if not existing:
                 return
             
-            # Show validation message if it's a warning
-            if "Large folder" in message:
-                print(f"⚠️  Warning: {message}")
-            
-            # Get folder info
-            info = get_folder_info(source)
-            print(f"📁 Source: {info['name']}")
-            print(f"📊 Size: {format_file_size(info['total_size'])}")
-            print(f"📄 Files: {info['file_count']} files in {info['folder_count']} folders")
-            print()
-            
-            # Determine output directory
-            if output_dir is None:
-                config = self.config_manager.get_config()
-                output_dir = config.default_output_dir
-            
-            output_path = Path(output_dir)
-            output_path.mkdir(parents=True, exist_ok=True)
+            config = self.config_manager.get_config()
+            self.torrent_manager = TorrentManager.get_shared(config, self.config_manager)
             
-            print(f"💾 Output directory: {output_dir}")
-            print(f"🔒 Private torrent: {'Yes' if private else 'No'}")
-            print(f"🌱 Start seeding: {'Yes' if start_seeding else 'No'}")
+            # Folder scans (disk-bound, in threads) and the connection test (network-bound)
+            # are independent, so run them concurrently. The scans are scheduled first so
+            # their threads are already running while the connection test executes.
+            print("🔌 Scanning sources and testing qBittorrent connection...")
+            *infos, (success, message) = await asyncio.gather(
+                *(asyncio.to_thread(get_folder_info, Path(path)) for path in existing),
+                self.torrent_manager.test_connection()
+            )
             print()
             
-            # Test qBittorrent connection first
-            print("🔌 Testing qBittorrent connection...")
-            config = self.config_manager.get_config()
-            self.torrent_manager = TorrentManager(config, self.config_manager)
+            # Validate every source, skipping the invalid ones
+            sources = [
+                path for path, info in zip(existing, infos)
+                if self._check_source(path, info)
+            ]
+            if not sources:
+                return
             
-            success, message = await self.torrent_manager.test_connection()
             if not success:
                 print(f"❌ qBittorrent connection failed: {message}")
                 print("💡 Please check your qBittorrent configuration and ensure it's running")
                 return
             
-            print(f"✅ {message}")
-            print()
+            # Determine output directory
+            if output_dir is None:
+                output_dir = config.default_output_dir
             
-            # Create torrent
-            print("🚀 Creating torrent...")
-            result = await self.torrent_manager.create_torrent(
-                source_path=source_path,
-                output_dir=output_dir,
-                private=private,
-                start_seeding=start_seeding
-            )
+            await asyncio.to_thread(ensure_directory, output_dir)
             
-            if result["success"]:
-                print("✅ Torrent created successfully!")
-                print()
-                
-                if result.get("torrent_path"):
-                    print(f"💾 Torrent file: {result['torrent_path']}")
-                
-                if result.get("torrent_hash"):
-                    print(f"🔑 Hash: {result['torrent_hash']}")
-                
-                if start_seeding and result.get("torrent_hash"):
-                    print("🌱 Torrent has been added to qBittorrent for seeding")
-                
-            else:
-                print("❌ Torrent creation failed!")
-                error = result.get("error", "Unknown error")
-                print(f"💥 Error: {error}")
+            _write_lines([
+                f"💾 Output directory: {output_dir}",
+                f"🔒 Private torrent: {'Yes' if private else 'No'}",
+                f"🌱 Start seeding: {'Yes' if start_seeding else 'No'}",
+                "",
+                f"✅ {message}",
+                "",
+            ])
+            
+            # Create torrents concurrently, bounded to avoid flooding the Web API
+            print(f"🚀 Creating {len(sources)} torrent(s)...")
+            results = await self.torrent_manager.create_torrents([
+                {
+                    "source_path": path,
+                    "output_dir": output_dir,
+                    "private": private,
+                    "start_seeding": start_seeding,
+                }
+                for path in sources
+            ])
+            
+            for path, result in zip(sources, results):
+                self._print_result(path, result, start_seeding)
                 
         except KeyboardInterrupt:
             print("\n❌ Operation cancelled by user")
         except Exception as e:
             print(f"❌ Unexpected error: {e}")
-        finally:
-            if self.torrent_manager:
-                await self.torrent_manager.disconnect()
+    
+    def _check_source(self, source_path: str, info: Dict[str, Any]) -> bool:
+        """Validate a scanned source and print its summary, returning whether it is usable"""
+        # Validate source for torrent creation
+        is_valid, message = validate_folder_for_torrent(Path(source_path), info)
+        if not is_valid:
+            print(f"❌ Error: {source_path}: {message}")
+            return False
+        
+        lines = []
+        
+        # Show validation message if it's a warning
+        if "Large folder" in message:
+            lines.append(f"⚠️  Warning: {message}")
+        
+        lines += [
+            f"📁 Source: {info['name']}",
+            f"📊 Size: {format_file_size(info['total_size'])}",
+            f"📄 Files: {info['file_count']} files in {info['folder_count']} folders",
+            "",
+        ]
+        _write_lines(lines)
+        return True
+    
+    def _print_result(self, source_path: str, result: dict, start_seeding: bool):
+        """Print the outcome of a single torrent creation"""
+        name = Path(source_path).name
+        
+        if result["success"]:
+            lines = [f"✅ Torrent created successfully: {name}"]
+            
+            if result.get("torrent_path"):
+                lines.append(f"💾 Torrent file: {result['torrent_path']}")
+            
+            if result.get("torrent_hash"):
+                lines.append(f"🔑 Hash: {result['torrent_hash']}")
+            
+            if start_seeding and result.get("torrent_hash"):
+                lines.append("🌱 Torrent has been added to qBittorrent for seeding")
+            
+        else:
+            error = result.get("error", "Unknown error")
+            lines = [
+                f"❌ Torrent creation failed: {name}",
+                f"💥 Error: {error}",
+            ]
+        lines.append("")
+        _write_lines(lines)
 
 
 def print_cli_help():
@@ -126,7 +183,7 @@ def print_cli_help():
 📦 Easy Torrent Creator - CLI Mode
 
 Usage:
-  python main.py --cli /path/to/folder [options]
+  python main.py --cli /path/to/folder [/path/to/other ...] [options]
 
 Options:
   --output DIR         Output directory for torrent file
@@ -139,6 +196,9 @@ Examples:
   # Create torrent from a folder
   python main.py --cli /home/user/MyFolder
 
+  # Create torrents for several folders in one run
+  python main.py --cli /home/user/FolderA /home/user/FolderB
+
   # Create torrent with custom output directory
   python main.py --cli /home/user/MyFolder --output /home/user/torrents
 
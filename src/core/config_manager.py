@@ -3,16 +3,68 @@ Configuration Manager
 Handles loading, validation, and management of application configuration
 """
 import os
+import re
+import sys
+import copy
+import json
+import logging
+import tempfile
+import time
+from collections import OrderedDict, deque
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, Tuple, FrozenSet
+from dataclasses import dataclass, replace, fields
 from enum import Enum
+from functools import lru_cache
 
 try:
     import yaml
 except ImportError:
     yaml = None
 
+# Prefer the LibYAML C loader/dumper when PyYAML was built with them
+if yaml is not None:
+    try:
+        from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+    except ImportError:
+        from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+# Matches ${VAR} references in configuration values (and in the raw file bytes)
+_ENV_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+_ENV_VAR_BYTES_RE = re.compile(rb'\$\{([^}]+)\}')
+
+# Encrypted credential store consulted when resolving ${VAR} references
+_CREDENTIALS_FILE = "config/.credentials"
+
+
+logger = logging.getLogger(__name__)
+
+# Config dataclasses are frozen so parsed and resolved configs can be shared
+# without defensive copies; slots (Python 3.10+) drop the per-instance __dict__
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Window within which repeated stat() calls on the same path reuse the first result
+_STAT_TTL = 0.1
+
+
+def _cached_stat(path: Path) -> Optional[os.stat_result]:
+    """
+    stat() a path, reusing the result for up to _STAT_TTL seconds
+    
+    Returns None when the path does not exist. Writers in this module call
+    _stat_in_window.cache_clear() so they always see their own changes.
+    """
+    return _stat_in_window(str(path), int(time.monotonic() / _STAT_TTL))
+
+
+@lru_cache(maxsize=64)
+def _stat_in_window(path: str, window: int) -> Optional[os.stat_result]:
+    """Cached os.stat keyed on path and time window"""
+    try:
+        return os.stat(path)
+    except OSError:
+        return None
+
 
 class TorrentFormat(Enum):
     """Supported torrent formats"""
@@ -21,7 +73,28 @@ class TorrentFormat(Enum):
     HYBRID = "hybrid"
 
 
-@dataclass
+_VALID_FORMATS = frozenset(f.value for f in TorrentFormat)
+
+
+def _dc_to_dict(obj) -> Dict[str, Any]:
+    """
+    Convert a flat config dataclass to a dictionary
+    
+    Cheaper than dataclasses.asdict: tuple/list and dict fields become a fresh
+    list or dict (their items are plain values) instead of a recursive deepcopy.
+    """
+    result = {}
+    for f in fields(obj):
+        value = getattr(obj, f.name)
+        if isinstance(value, (tuple, list)):
+            value = list(value)
+        elif isinstance(value, dict):
+            value = dict(value)
+        result[f.name] = value
+    return result
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class QBittorrentConfig:
     """qBittorrent connection and behavior configuration"""
     host: str = "localhost"
@@ -43,27 +116,27 @@ class QBittorrentConfig:
     read_timeout: float = 30.0        # Read timeout in seconds
     pool_connections: int = 10        # HTTP connection pool size
     pool_maxsize: int = 10           # HTTP connection pool max size
+    max_concurrent_tasks: int = 4     # Parallel torrent creation tasks in batch mode
     
     # qBittorrent behavior
     category: str = "torrents"
     save_path: str = "/downloads"
     auto_add_after_creation: bool = True
     auto_torrent_management: bool = False
-    tags: Optional[List[str]] = None
-    trackers: Optional[List[str]] = None
+    tags: Optional[Tuple[str, ...]] = None
+    trackers: Optional[Tuple[str, ...]] = None
     docker_path_mapping: Optional[Dict[str, str]] = None
     max_tag_length: int = 50
     
     def __post_init__(self):
-        if self.tags is None:
-            self.tags = []
-        if self.trackers is None:
-            self.trackers = []
+        # Frozen instance: normalise through object.__setattr__
+        object.__setattr__(self, 'tags', tuple(self.tags or ()))
+        object.__setattr__(self, 'trackers', tuple(self.trackers or ()))
         if self.docker_path_mapping is None:
-            self.docker_path_mapping = {}
+            object.__setattr__(self, 'docker_path_mapping', {})
 
 
-@dataclass 
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class TorrentCreationConfig:
     """Torrent creation specific configuration"""
     format: str = "v2"
@@ -75,15 +148,14 @@ class TorrentCreationConfig:
     padded_file_size_limit: Optional[int] = None
     timeout: int = 300
     poll_interval: float = 1.0
-    url_seeds: Optional[List[str]] = None  # Web seeds / HTTP seeds
+    url_seeds: Optional[Tuple[str, ...]] = None  # Web seeds / HTTP seeds
     source: str = ""  # Content source/description
     
     def __post_init__(self):
-        if self.url_seeds is None:
-            self.url_seeds = []
+        object.__setattr__(self, 'url_seeds', tuple(self.url_seeds or ()))
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class WebServerConfig:
     """Web server configuration"""
     host: str = "0.0.0.0"
@@ -91,7 +163,7 @@ class WebServerConfig:
     reload: bool = True
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class DebugConfig:
     """Debug and logging configuration"""
     log_level: str = "INFO"
@@ -99,7 +171,7 @@ class DebugConfig:
     metrics: bool = False
 
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AppConfig:
     """Main application configuration"""
     qbittorrent: QBittorrentConfig
@@ -114,16 +186,17 @@ class AppConfig:
     
     def __post_init__(self):
         if self.debug is None:
-            self.debug = DebugConfig()
+            object.__setattr__(self, 'debug', DebugConfig())
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AppConfig':
         """Create AppConfig from dictionary"""
-        qbit_data = data.get('qbittorrent', {})
-        creation_data = data.get('torrent_creation', {})
-        web_server_data = data.get('web_server', {})
+        _known_fields('top-level', data, _APP_CONFIG_FIELDS)
+        qbit_data = _known_fields('qbittorrent', data.get('qbittorrent'), _QBIT_FIELDS)
+        creation_data = _known_fields('torrent_creation', data.get('torrent_creation'), _CREATION_FIELDS)
+        web_server_data = _known_fields('web_server', data.get('web_server'), _WEB_SERVER_FIELDS)
         docker_mapping_data = data.get('docker_mapping', {})
-        debug_data = data.get('debug', {})
+        debug_data = _known_fields('debug', data.get('debug'), _DEBUG_FIELDS)
         
         return cls(
             qbittorrent=QBittorrentConfig(**qbit_data),
@@ -140,9 +213,9 @@ class AppConfig:
     def to_dict(self) -> Dict[str, Any]:
         """Convert AppConfig to dictionary"""
         result = {
-            'qbittorrent': asdict(self.qbittorrent),
-            'torrent_creation': asdict(self.torrent_creation),
-            'web_server': asdict(self.web_server),
+            'qbittorrent': _dc_to_dict(self.qbittorrent),
+            'torrent_creation': _dc_to_dict(self.torrent_creation),
+            'web_server': _dc_to_dict(self.web_server),
             'default_output_dir': self.default_output_dir,
             'default_upload_root': self.default_upload_root,
             'remember_last_folder': self.remember_last_folder,
@@ -150,14 +223,80 @@ class AppConfig:
         }
         
         if self.docker_mapping:
-            result['docker_mapping'] = self.docker_mapping
+            result['docker_mapping'] = copy.deepcopy(self.docker_mapping)
             
         if self.debug:
-            result['debug'] = asdict(self.debug)
+            result['debug'] = _dc_to_dict(self.debug)
             
         return result
 
 
+# Field names of each config dataclass, used to filter unknown keys
+_APP_CONFIG_FIELDS = frozenset(f.name for f in fields(AppConfig))
+_QBIT_FIELDS = frozenset(f.name for f in fields(QBittorrentConfig))
+_CREATION_FIELDS = frozenset(f.name for f in fields(TorrentCreationConfig))
+_WEB_SERVER_FIELDS = frozenset(f.name for f in fields(WebServerConfig))
+_DEBUG_FIELDS = frozenset(f.name for f in fields(DebugConfig))
+
+
+def _known_fields(section: str, data: Optional[Dict[str, Any]], names: FrozenSet[str]) -> Dict[str, Any]:
+    """
+    Drop the keys of a config section that are not dataclass fields
+    
+    Args:
+        section: Section name used in the warning
+        data: Raw section data from the config file
+        names: Field names accepted by the section's dataclass
+        
+    Returns:
+        The data itself when every key is known, otherwise a filtered copy
+    """
+    if not data:
+        return {}
+    
+    unknown = data.keys() - names
+    if not unknown:
+        return data
+    
+    logger.warning(f"Ignoring unknown {section} config keys: {', '.join(sorted(unknown))}")
+    return {key: value for key, value in data.items() if key in names}
+
+
+# Longer strings (comments, paths) are rarely repeated and are not interned
+_INTERN_MAX_LEN = 128
+
+
+def _intern_strings(data: Any) -> Any:
+    """Intern the short string values of parsed config data in place so duplicates share storage"""
+    if isinstance(data, str):
+        return sys.intern(data) if len(data) < _INTERN_MAX_LEN else data
+    
+    pending = deque([data])
+    while pending:
+        current = pending.pop()
+        if isinstance(current, dict):
+            items = current.items()
+        elif isinstance(current, list):
+            items = enumerate(current)
+        else:
+            continue
+        for key, value in items:
+            if isinstance(value, str):
+                if len(value) < _INTERN_MAX_LEN:
+                    current[key] = sys.intern(value)
+            elif isinstance(value, (dict, list)):
+                pending.append(value)
+    return data
+
+
+# Parsed configurations shared by all ConfigManager instances,
+# keyed by (absolute path, st_mtime_ns, st_size) and evicted least recently used first.
+# Each entry also records the variable names referenced by ${...} in the file and
+# the to_dict() snapshot used by save_config to detect unchanged configs.
+_PARSE_CACHE: "OrderedDict[tuple, Tuple[AppConfig, FrozenSet[str], Dict[str, Any]]]" = OrderedDict()
+_PARSE_CACHE_MAXSIZE = 32
+
+
 class ConfigManager:
     """Manages application configuration loading, saving, and validation"""
     
@@ -165,16 +304,56 @@ class ConfigManager:
         self.config_path = Path(config_path)
         self.config: Optional[AppConfig] = None
         self._last_folder_file = Path("config/.last_folder")
+        # Parsed YAML is mirrored to a JSON sidecar so unchanged configs skip the YAML parser
+        self._cache_path = self.config_path.with_suffix('.yaml.cache.json')
+        # Secure credential lookups, memoized for the duration of a resolve pass
+        self._cred_mgr = None
+        self._cred_cache: Dict[str, Optional[str]] = {}
+        # Variable names referenced by ${...} in the loaded file, or None when unknown
+        # because the config was changed in memory, and the config object they describe;
+        # get_resolved_config recollects them when self.config is a different object
+        self._referenced_vars: Optional[FrozenSet[str]] = None
+        self._referenced_config: Optional[AppConfig] = None
+        # to_dict() of the config as last loaded from or written to disk
+        self._saved_data: Optional[Dict[str, Any]] = None
+        # (fingerprint, resolved config) of the last get_resolved_config call
+        self._resolved_cache: Optional[Tuple[tuple, AppConfig]] = None
+        # (st_mtime_ns, folder) of the last .last_folder read
+        self._last_folder_cache: Optional[Tuple[int, str]] = None
+        # (config, auth_mode, password_ref) captured by load_config for get_password
+        self._creds_only: Optional[Tuple[AppConfig, str, str]] = None
+        # (config, result) of the last validate_qbittorrent_config call
+        self._validation_cache: Optional[Tuple[AppConfig, Tuple[bool, str]]] = None
         
     def load_config(self) -> AppConfig:
         """Load configuration from file or create default"""
-        if self.config_path.exists():
+        self._validation_cache = None
+        # One stat() covers both the existence check and the cache key
+        st = _cached_stat(self.config_path)
+        if st is not None:
             if yaml is None:
                 raise ConfigError("PyYAML is required but not installed. Please install with: pip install PyYAML")
             try:
-                with open(self.config_path, 'r') as f:
-                    data = yaml.safe_load(f) or {}
+                key = (str(self.config_path.resolve()), st.st_mtime_ns, st.st_size)
+                cached = _PARSE_CACHE.get(key)
+                if cached is not None:
+                    _PARSE_CACHE.move_to_end(key)
+                    self.config = cached[0]
+                    self._referenced_vars = cached[1]
+                    self._referenced_config = self.config
+                    self._saved_data = cached[2]
+                    self._remember_auth_refs()
+                    return self.config
+                
+                data = self._read_config_data(st)
                 self.config = AppConfig.from_dict(data)
+                self._referenced_config = self.config
+                self._saved_data = self.config.to_dict()
+                
+                _PARSE_CACHE[key] = (self.config, self._referenced_vars, self._saved_data)
+                if len(_PARSE_CACHE) > _PARSE_CACHE_MAXSIZE:
+                    _PARSE_CACHE.popitem(last=False)
+                self._remember_auth_refs()
                 return self.config
             except Exception as e:
                 raise ConfigError(f"Failed to load config from {self.config_path}: {e}")
@@ -182,122 +361,327 @@ class ConfigManager:
             # Create default configuration
             self.config = self._create_default_config()
             self.save_config()
+            self._referenced_vars = frozenset()
+            self._referenced_config = self.config
+            self._remember_auth_refs()
             return self.config
     
+    @staticmethod
+    def invalidate_cache() -> None:
+        """Drop all in-memory parsed configurations (e.g. between tests)"""
+        _PARSE_CACHE.clear()
+    
+    def _read_config_data(self, config_stat: os.stat_result) -> Dict[str, Any]:
+        """
+        Read raw config data, using the JSON sidecar cache when it is up to date
+        
+        Also records the variable names referenced by ${...} in the file, so that
+        get_resolved_config can skip or reuse the resolution walk.
+        """
+        # The cache records the (mtime, size) of the YAML it was built from and is only
+        # used for exactly that file, so a replaced file with an older mtime is re-parsed
+        source = [config_stat.st_mtime_ns, config_stat.st_size]
+        try:
+            if _cached_stat(self._cache_path) is not None:
+                with open(self._cache_path, 'rb') as f:
+                    raw = f.read()
+                cached = json.loads(raw)
+                if isinstance(cached, dict) and cached.get('source') == source and isinstance(cached.get('data'), dict):
+                    data = _intern_strings(cached['data'])
+                    self._referenced_vars = self._scan_referenced_vars(raw)
+                    return data
+        except (OSError, ValueError):
+            pass  # Missing or unreadable cache - fall back to parsing the YAML
+        
+        # LibYAML consumes bytes directly, so skip the text-mode decode layer
+        with open(self.config_path, 'rb') as f:
+            raw = f.read()
+        data = _intern_strings(yaml.load(raw, Loader=_SafeLoader) or {})
+        self._referenced_vars = self._scan_referenced_vars(raw)
+        
+        self._write_cache(data, source)
+        return data
+    
+    def _write_cache(self, data: Dict[str, Any], source: list) -> None:
+        """
+        Atomically write the parsed config to the JSON sidecar cache
+        
+        Args:
+            data: Parsed YAML data
+            source: [st_mtime_ns, st_size] of the YAML file the data was parsed from
+        """
+        try:
+            # JSON turns non-string keys into strings and cannot encode e.g. dates;
+            # only cache data that survives the round trip unchanged
+            payload = json.dumps({'source': source, 'data': data})
+            if json.loads(payload)['data'] != data:
+                return
+            
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self._cache_path.parent, prefix=self._cache_path.name, suffix='.tmp'
+            )
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    f.write(payload)
+                os.replace(tmp_path, self._cache_path)
+                _stat_in_window.cache_clear()
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except Exception:
+            pass  # Non-critical failure, the YAML remains the source of truth
+    
     def save_config(self) -> None:
-        """Save current configuration to file"""
+        """Save current configuration to file, skipping the write when nothing changed"""
         if not self.config:
             raise ConfigError("No configuration to save")
         
+        # Compare against what is on disk rather than tracking a dirty flag, since
+        # callers such as SettingsStorageManager also assign self.config directly
+        data = self.config.to_dict()
+        if data == self._saved_data and _cached_stat(self.config_path) is not None:
+            return
+        
         # Ensure config directory exists
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         
         if yaml is None:
             raise ConfigError("PyYAML is required but not installed. Please install with: pip install PyYAML")
         
+        # The saved values may now contain ${...} references or come from a replaced config
+        self._referenced_vars = None
+        self._validation_cache = None
+        
         try:
-            with open(self.config_path, 'w') as f:
-                yaml.dump(self.config.to_dict(), f, default_flow_style=False, indent=2)
+            # Serialise once, then swap the file in atomically so a crash cannot leave it half written
+            content = yaml.dump(data, Dumper=_SafeDumper, default_flow_style=False, indent=2, encoding='utf-8')
+            try:
+                mode = os.stat(self.config_path).st_mode
+            except FileNotFoundError:
+                mode = None  # New file - keep mkstemp's owner-only permissions
+            
+            # The temp file is created owner-only; the file may hold plaintext passwords
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.config_path.parent, prefix=self.config_path.name + '.', suffix='.tmp'
+            )
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(content)
+                    f.flush()
+                    os.fsync(f.fileno())
+                if mode is not None:
+                    os.chmod(tmp_path, mode)
+                os.replace(tmp_path, self.config_path)
+            except OSError:
+                # e.g. a config file bind-mounted into a container cannot be replaced
+                Path(tmp_path).unlink(missing_ok=True)
+                self.config_path.write_bytes(content)
+            self._saved_data = data
+            _stat_in_window.cache_clear()
         except Exception as e:
             raise ConfigError(f"Failed to save config to {self.config_path}: {e}")
     
     def get_config(self) -> AppConfig:
         """Get current configuration, loading if necessary"""
-        if not self.config:
+        if self.config is None:
             return self.load_config()
         return self.config
     
-    def _resolve_env_vars(self, value):
-        """Resolve environment variables and secure credentials in configuration values"""
+    def _resolve_env_vars(self, value, table: Optional[Dict[str, Optional[str]]] = None):
+        """
+        Resolve environment variables and secure credentials in configuration values
+        
+        Args:
+            value: Value to resolve (non-strings are returned unchanged)
+            table: Pre-resolved variable values, looked up instead of the stores
+        """
         if not isinstance(value, str):
             return value
         
+        # Fast path: skip the regex machinery entirely for plain values
         if '${' not in value:
             return value
         
-        import re
-        
         def replace_var(match):
             var_name = match.group(1)
-            
-            # Try to get from secure credential manager if available
-            try:
+            if table is not None and var_name in table:
+                resolved = table[var_name]
+            else:
+                resolved = self._lookup(var_name)
+            # Leave unknown references untouched
+            return resolved if resolved is not None else match.group(0)
+        
+        return _ENV_VAR_RE.sub(replace_var, value)
+    
+    def _lookup(self, var_name: str) -> Optional[str]:
+        """Look up a ${VAR} reference in the secure credential store, then the environment"""
+        # Try to get from secure credential manager if available
+        secure_value = self._get_secure_credential(var_name)
+        if secure_value is not None:
+            return secure_value
+        
+        # For backwards compatibility, try QB_PASSWORD if QBIT_PASSWORD was requested
+        if var_name == 'QBIT_PASSWORD':
+            secure_value = self._get_secure_credential('QB_PASSWORD')
+            if secure_value is not None:
+                return secure_value
+        
+        # Fall back to environment variables
+        return os.environ.get(var_name)
+    
+    def _get_secure_credential(self, var_name: str) -> Optional[str]:
+        """Get a credential from secure storage, memoized until the next resolve pass"""
+        if var_name in self._cred_cache:
+            return self._cred_cache[var_name]
+        
+        value = None
+        try:
+            if self._cred_mgr is None:
                 from ..utils.credential_manager import CredentialManager
-                credential_manager = CredentialManager()
-                secure_value = credential_manager.get_credential(var_name)
-                if secure_value is not None:
-                    return secure_value
-                
-                # For backwards compatibility, try QB_PASSWORD if QBIT_PASSWORD was requested
-                if var_name == 'QBIT_PASSWORD':
-                    secure_value = credential_manager.get_credential('QB_PASSWORD')
-                    if secure_value is not None:
-                        return secure_value
-                
-            except Exception:
-                pass
-            
-            # Fall back to environment variables
-            return os.environ.get(var_name, match.group(0))
+                self._cred_mgr = CredentialManager(_CREDENTIALS_FILE)
+            value = self._cred_mgr.get_credential(var_name)
+        except Exception:
+            pass
         
-        pattern = r'\$\{([^}]+)\}'
-        return re.sub(pattern, replace_var, value)
+        self._cred_cache[var_name] = value
+        return value
+    
+    @staticmethod
+    def _scan_referenced_vars(raw: bytes) -> FrozenSet[str]:
+        """Collect the variable names referenced by ${...} in raw config bytes"""
+        if b'${' not in raw:
+            return frozenset()
+        return frozenset(name.decode('utf-8', 'replace') for name in _ENV_VAR_BYTES_RE.findall(raw))
     
-    def _resolve_config_values(self, obj):
-        """Recursively resolve environment variables in configuration object"""
+    @staticmethod
+    def _credentials_mtime() -> Optional[int]:
+        """Modification time of the secure credential store, or None if it does not exist"""
+        try:
+            return os.stat(_CREDENTIALS_FILE).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _resolve_config_values(self, obj, table: Optional[Dict[str, Optional[str]]] = None):
+        """
+        Resolve environment variables in plain configuration data
+        
+        Walks dicts and lists with an explicit work queue and updates them in
+        place, so it must be given freshly built data (see AppConfig.to_dict).
+        """
         if isinstance(obj, str):
-            return self._resolve_env_vars(obj)
-        elif isinstance(obj, dict):
-            return {key: self._resolve_config_values(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._resolve_config_values(item) for item in obj]
-        elif hasattr(obj, '__dict__'):
-            # Handle dataclass instances
-            for field_name in obj.__dict__:
-                field_value = getattr(obj, field_name)
-                resolved_value = self._resolve_config_values(field_value)
-                setattr(obj, field_name, resolved_value)
-            return obj
-        else:
-            return obj
+            return self._resolve_env_vars(obj, table)
+        
+        pending = deque([obj])
+        while pending:
+            current = pending.pop()
+            if isinstance(current, dict):
+                for key, value in current.items():
+                    if isinstance(value, str):
+                        resolved = self._resolve_env_vars(value, table)
+                        if resolved is not value:
+                            current[key] = resolved
+                    elif isinstance(value, (dict, list)):
+                        pending.append(value)
+            elif isinstance(current, list):
+                for i, value in enumerate(current):
+                    if isinstance(value, str):
+                        resolved = self._resolve_env_vars(value, table)
+                        if resolved is not value:
+                            current[i] = resolved
+                    elif isinstance(value, (dict, list)):
+                        pending.append(value)
+        return obj
+    
+    @staticmethod
+    def _collect_refs(obj) -> FrozenSet[str]:
+        """Collect the variable names referenced by ${...} anywhere in plain configuration data"""
+        names = set()
+        pending = deque([obj])
+        while pending:
+            current = pending.pop()
+            if isinstance(current, str):
+                if '${' in current:
+                    names.update(_ENV_VAR_RE.findall(current))
+            elif isinstance(current, dict):
+                pending.extend(current.values())
+            elif isinstance(current, list):
+                pending.extend(current)
+        return frozenset(names)
     
     def get_resolved_config(self) -> AppConfig:
         """Get configuration with all environment variables and secure credentials resolved"""
         if not self.config:
             self.load_config()
         
-        # Create a copy and resolve all variables
-        import copy
-        resolved_config = copy.deepcopy(self.config)
-        if resolved_config:
-            self._resolve_config_values(resolved_config)
-            return resolved_config
-        else:
-            return self._create_default_config()
+        # Callers such as SettingsStorageManager assign self.config directly, so the
+        # references found at load time only hold for the config object they came from
+        referenced = self._referenced_vars
+        if referenced is None or self._referenced_config is not self.config:
+            referenced = self._referenced_vars = self._collect_refs(self.config.to_dict())
+            self._referenced_config = self.config
+        
+        # Nothing to substitute - the (immutable) config is already fully resolved
+        if referenced is not None and not referenced:
+            return self.config
+        
+        # Reuse the last result while the config, the referenced environment
+        # variables and the credential store are all unchanged
+        fingerprint = (
+            self.config,
+            tuple(os.environ.get(name) for name in sorted(referenced)),
+            self._credentials_mtime()
+        )
+        cached = self._resolved_cache
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1]
+        
+        # Pick up credentials changed since the previous resolve
+        self._cred_cache.clear()
+        
+        # Look up each referenced variable once, however often it appears
+        data = self.config.to_dict()
+        table = {name: self._lookup(name) for name in referenced}
+        
+        # Resolve a plain-data copy and rebuild the frozen config from it
+        resolved_config = AppConfig.from_dict(self._resolve_config_values(data, table))
+        self._resolved_cache = (fingerprint, resolved_config)
+        return resolved_config
     
     def update_config(self, **kwargs) -> None:
         """Update configuration with new values"""
         if not self.config:
             self.load_config()
         
-        # Update configuration attributes
-        for key, value in kwargs.items():
-            if hasattr(self.config, key):
-                setattr(self.config, key, value)
-            else:
+        for key in kwargs:
+            if key not in _APP_CONFIG_FIELDS:
                 raise ConfigError(f"Unknown configuration key: {key}")
+        
+        # New values may contain ${...} references and need validating again
+        self._referenced_vars = None
+        self._validation_cache = None
+        
+        # Configs are immutable - build an updated copy
+        self.config = replace(self.config, **kwargs)
     
     def get_last_folder(self) -> Optional[str]:
         """Get the last used folder path"""
         if self.config and not self.config.remember_last_folder:
             return None
             
+        st = _cached_stat(self._last_folder_file)
+        if st is None:
+            return None
+        
+        cached = self._last_folder_cache
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            return cached[1]
+        
         try:
-            if self._last_folder_file.exists():
-                return self._last_folder_file.read_text().strip()
-        except Exception:
-            pass
-        return None
+            folder = self._last_folder_file.read_bytes().decode().strip()
+        except (OSError, UnicodeDecodeError):
+            return None
+        self._last_folder_cache = (st.st_mtime_ns, folder)
+        return folder
     
     def save_last_folder(self, folder_path: str) -> None:
         """Save the last used folder path"""
@@ -307,14 +691,26 @@ class ConfigManager:
         try:
             self._last_folder_file.parent.mkdir(parents=True, exist_ok=True)
             self._last_folder_file.write_text(folder_path)
+            self._last_folder_cache = None
+            _stat_in_window.cache_clear()
         except Exception:
             pass  # Non-critical failure
     
     def validate_qbittorrent_config(self) -> tuple[bool, str]:
-        """Validate qBittorrent configuration"""
+        """Validate qBittorrent configuration, reusing the last result while the config is unchanged"""
         if not self.config:
             return False, "Configuration not loaded"
         
+        cached = self._validation_cache
+        if cached is not None and cached[0] is self.config:
+            return cached[1]
+        
+        result = self._check_qbittorrent_config()
+        self._validation_cache = (self.config, result)
+        return result
+    
+    def _check_qbittorrent_config(self) -> tuple[bool, str]:
+        """Run the qBittorrent configuration checks"""
         qbit = self.config.qbittorrent
         
         # Check required fields
@@ -328,10 +724,9 @@ class ConfigManager:
             return False, "qBittorrent password is required"
         
         # Validate format
-        try:
-            TorrentFormat(self.config.torrent_creation.format)
-        except ValueError:
-            return False, f"Invalid torrent format: {self.config.torrent_creation.format}"
+        fmt = self.config.torrent_creation.format
+        if fmt not in _VALID_FORMATS:
+            return False, f"Invalid torrent format: {fmt}"
         
         return True, "Configuration is valid"
     
@@ -343,30 +738,49 @@ class ConfigManager:
             web_server=WebServerConfig()
         )
     
+    def _remember_auth_refs(self) -> None:
+        """Capture the auth mode and password reference of the loaded config"""
+        qbit = self.config.qbittorrent
+        auth = qbit.auth or {}
+        self._creds_only = (
+            self.config,
+            auth.get('mode', qbit.auth_mode),
+            auth.get('password_ref', qbit.password_ref)
+        )
+    
     def get_password(self) -> str:
         """Get password, resolving environment variables if needed"""
+        # Fast path: with secret auth the password is just a credential/environment lookup
+        creds = self._creds_only
+        if creds is not None and creds[0] is self.config and creds[1] == 'secret':
+            secret = self._lookup(creds[2])
+            if secret:
+                return secret
+        
         config = self.get_config()  # This ensures config is loaded
         
         password = config.qbittorrent.password
         
         # Handle environment variable passwords
-        if password.startswith('${') and password.endswith('}'):
-            env_var = password[2:-1]
-            env_password = os.getenv(env_var)
+        match = _ENV_VAR_RE.fullmatch(password)
+        if match:
+            env_password = self._lookup(match.group(1))
             if not env_password:
-                raise ConfigError(f"Environment variable {env_var} not set")
+                raise ConfigError(f"Environment variable {match.group(1)} not set")
             return env_password
         
         return password
     
     def resolve_environment_variables(self, value):
         """Resolve environment variables in any config value"""
-        if isinstance(value, str) and value.startswith('${') and value.endswith('}'):
-            env_var = value[2:-1]
-            env_value = os.getenv(env_var)
-            if env_value is None:
-                raise ConfigError(f"Environment variable {env_var} not set")
-            return env_value
+        if isinstance(value, str):
+            match = _ENV_VAR_RE.fullmatch(value)
+            if match:
+                env_value = self._lookup(match.group(1))
+                if env_value is None:
+                    raise ConfigError(f"Environment variable {match.group(1)} not set")
+                return env_value
+            return value
         elif isinstance(value, list):
             return [self.resolve_environment_variables(item) for item in value]
         return value
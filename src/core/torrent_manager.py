@@ -3,18 +3,406 @@ Torrent Manager
 Uses qBittorrent v5.0.0+ Torrent Creator API for proper torrent creation
 """
 import asyncio
+import atexit
+import hashlib
+import logging
 import sys
 import os
+import random
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import qbittorrentapi
 from qbittorrentapi.torrentcreator import TaskStatus
 from qbittorrentapi import exceptions as qba_exc
+from urllib3.exceptions import ConnectTimeoutError
+from urllib3.util.retry import Retry
 
-from ..core.config_manager import AppConfig
+from ..core.config_manager import AppConfig, DATACLASS_SLOTS
 from ..utils.credential_manager import CredentialManager
 from ..utils.docker_path_mapper import DockerPathMapper
 
+logger = logging.getLogger(__name__)
+
+
+# Logged-in qBittorrent clients shared by all TorrentManager instances,
+# keyed by (url, username, password), with the time each one logged in
+_shared_clients: Dict[Tuple[str, str, str], Any] = {}
+_login_times: Dict[Tuple[str, str, str], float] = {}
+
+# qBittorrent's export directory for saved .torrent files, as seen inside its container
+_CONTAINER_EXPORT_DIR = "/data/downloads/torrents/qbittorrent/files"
+
+# Leading "major.minor" of a qBittorrent version, ignoring a "v" prefix and any pre-release suffix
+_VERSION_RE = re.compile(r'v?(\d+)(?:\.(\d+))?')
+
+# Log in afresh once a shared session is this old (qBittorrent's default session timeout is 1 hour)
+_SESSION_MAX_AGE = 55 * 60
+
+# add_task attempts on failures that never reached the server, with jittered exponential
+# backoff from this base delay (a Retry-After header on 503 replaces the backoff)
+_ADD_TASK_ATTEMPTS = 3
+_ADD_TASK_RETRY_DELAY = 1.0
+
+# Check an idle client is still alive before reusing it
+_IDLE_PING_AFTER = 30.0
+
+# How long a credential read from the secure store is reused
+_CREDENTIAL_TTL = 60.0
+
+# Read size when hashing saved .torrent files, and how many file hashes a manager keeps
+_HASH_CHUNK_SIZE = 1024 * 1024
+_HASH_CACHE_MAXSIZE = 256
+
+# Task status polling: start fast and back off towards the configured poll interval
+_POLL_INITIAL_DELAY = 0.1
+_POLL_BACKOFF = 1.5
+# Consecutive failed status requests before the waiting tasks are failed
+_POLL_MAX_FAILURES = 5
+
+# Transport-level retries for transient Web UI errors. Read and status retries are limited
+# to GET requests; an exhausted status retry returns the response so qbittorrentapi still
+# raises HTTP5XXError with the status code (as its own default Retry does)
+_HTTP_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    raise_on_status=False,
+)
+
+# Exceptions matched on every task lookup, bound once
+_NotFound = qba_exc.NotFound404Error
+_Conflict = qba_exc.Conflict409Error
+
+# User-facing messages for authentication failures, checked in order
+_AUTH_ERROR_MESSAGES = (
+    (qba_exc.LoginFailed, "❌ Authentication failed. Please check your qBittorrent credentials."),
+    (qba_exc.Forbidden403Error, "❌ IP address is banned from qBittorrent due to failed authentication attempts. Please wait or restart qBittorrent."),
+    (qba_exc.Unauthorized401Error, "❌ Unauthorized. Please check your qBittorrent credentials and ensure Web UI is enabled."),
+)
+_AUTH_ERRORS = tuple(cls for cls, _ in _AUTH_ERROR_MESSAGES)
+
+# Pre-flight TCP check before logging in, and how long a failed check is reused
+_PREFLIGHT_TIMEOUT = 2.0
+_PREFLIGHT_FAILURE_TTL = 5.0
+
+# (connection key, manager) of the TorrentManager handed out by TorrentManager.get_shared;
+# a single slot, so a manager replaced after a settings change is not kept alive
+_shared_manager: Optional[Tuple[Any, 'TorrentManager']] = None
+
+# One lock per event loop so concurrent callers do not all log in at once
+_client_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+def _client_lock() -> asyncio.Lock:
+    """Get the client creation lock for the running event loop"""
+    loop = asyncio.get_running_loop()
+    lock = _client_locks.get(loop)
+    if lock is None:
+        lock = _client_locks[loop] = asyncio.Lock()
+    return lock
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class _ConnectionSpec:
+    """qBittorrent connection and auth settings resolved once from the config"""
+    url: str
+    host: str
+    port: int
+    verify_tls: bool
+    connection_timeout: float
+    read_timeout: float
+    pool_connections: int
+    pool_maxsize: int
+    trackers: Tuple[str, ...]
+    # 'plain' uses plain_username/plain_password, anything else the credential refs
+    auth_mode: str = 'secret'
+    username_ref: str = 'QBIT_USERNAME'
+    password_ref: str = 'QBIT_PASSWORD'
+    plain_username: str = ''
+    plain_password: str = ''
+    
+    @classmethod
+    def from_config(cls, qbit_config) -> '_ConnectionSpec':
+        """Build from a QBittorrentConfig (or any object with the same attributes)"""
+        scheme = 'https' if getattr(qbit_config, 'use_https', False) else 'http'
+        base_path = getattr(qbit_config, 'base_path', '') or ''
+        
+        # The auth dict takes precedence over the legacy top-level auth fields
+        auth_config = getattr(qbit_config, 'auth', None)
+        if auth_config:
+            auth = {
+                'auth_mode': auth_config.get('mode', 'secret'),
+                'username_ref': auth_config.get('username_ref', 'QBIT_USERNAME'),
+                'password_ref': auth_config.get('password_ref', 'QBIT_PASSWORD'),
+                'plain_username': auth_config.get('username', ''),
+                'plain_password': auth_config.get('password', ''),
+            }
+        else:
+            auth = {
+                'auth_mode': getattr(qbit_config, 'auth_mode', 'secret'),
+                'username_ref': getattr(qbit_config, 'username_ref', 'QBIT_USERNAME'),
+                'password_ref': getattr(qbit_config, 'password_ref', 'QBIT_PASSWORD'),
+                'plain_username': getattr(qbit_config, 'username', ''),
+                'plain_password': getattr(qbit_config, 'password', ''),
+            }
+        
+        return cls(
+            **auth,
+            url=f"{scheme}://{qbit_config.host}:{qbit_config.port}{base_path}",
+            host=qbit_config.host,
+            port=int(qbit_config.port),
+            verify_tls=getattr(qbit_config, 'verify_tls', True),
+            connection_timeout=getattr(qbit_config, 'connection_timeout', 10.0),
+            read_timeout=getattr(qbit_config, 'read_timeout', 30.0),
+            pool_connections=getattr(qbit_config, 'pool_connections', 10),
+            # Room for every concurrent creation task plus the shared status poller
+            pool_maxsize=max(
+                getattr(qbit_config, 'pool_maxsize', 10),
+                getattr(qbit_config, 'max_concurrent_tasks', 4) + 1
+            ),
+            trackers=tuple(getattr(qbit_config, 'trackers', None) or ())
+        )
+
+
+def _docker_mapping(config) -> Dict[str, str]:
+    """Host -> container path mappings from qbittorrent.docker_path_mapping or the legacy docker_mapping"""
+    qbit_config = getattr(config, 'qbittorrent', None)
+    if qbit_config and hasattr(qbit_config, 'docker_path_mapping'):
+        docker_mapping = qbit_config.docker_path_mapping or {}
+        logger.debug("Found docker_path_mapping in qbittorrent config: %s", docker_mapping)
+    else:
+        # Fallback to top-level docker_mapping for backward compatibility
+        docker_mapping_config = getattr(config, 'docker_mapping', {}) or {}
+        docker_mapping = docker_mapping_config.get('mappings', {}) if docker_mapping_config else {}
+        logger.debug("Using fallback docker_mapping: %s", docker_mapping)
+    return docker_mapping
+
+
+def _shared_manager_key(config) -> Tuple[Optional['_ConnectionSpec'], Tuple[Tuple[str, str], ...]]:
+    """Settings a TorrentManager fixes at construction: the connection and the path mapping"""
+    qbit_config = getattr(config, 'qbittorrent', None)
+    spec = _ConnectionSpec.from_config(qbit_config) if qbit_config else None
+    return spec, tuple(sorted((str(k), str(v)) for k, v in _docker_mapping(config).items()))
+
+
+def _cleanup_shared_manager():
+    """Log out the shared TorrentManager at interpreter exit"""
+    if _shared_manager is None:
+        return
+    try:
+        asyncio.run(_shared_manager[1].cleanup())
+    except Exception:
+        pass  # Best effort during shutdown
+
+
+# Registered once; replaced managers are cleaned up by whoever replaced them
+atexit.register(_cleanup_shared_manager)
+
+
+def _connect_failed(error: BaseException) -> bool:
+    """
+    Whether a qbittorrentapi connection error happened before the request was sent
+    
+    qbittorrentapi raises APIConnectionError inside the handler for the requests error,
+    which wraps urllib3's MaxRetryError; only connect failures (refused, DNS, connect
+    timeout - all ConnectTimeoutError subclasses) are known not to have reached the server.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, ConnectTimeoutError) or isinstance(getattr(error, 'reason', None), ConnectTimeoutError):
+            return True
+        if error.args and isinstance(error.args[0], BaseException):
+            error = error.args[0]
+        else:
+            error = error.__cause__ or error.__context__
+    return False
+
+
+def _retry_after(error: Exception) -> Optional[float]:
+    """Seconds from the Retry-After header of an HTTP error response, if it has a numeric one"""
+    response = getattr(error, 'response', None)
+    try:
+        return max(float(response.headers['Retry-After']), 0.0)
+    except (AttributeError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _auth_error_message(error: Exception) -> str:
+    """User-facing message for one of the _AUTH_ERRORS exceptions"""
+    return next(message for cls, message in _AUTH_ERROR_MESSAGES if isinstance(error, cls))
+
+
+def _hash_stream(f) -> str:
+    """SHA-1 of an open binary file, streamed in chunks rather than read into memory at once"""
+    if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+        return hashlib.file_digest(f, 'sha1').hexdigest()
+    digest = hashlib.sha1()
+    for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _status_info_hash(status) -> Optional[str]:
+    """Info hash reported by a finished torrent creation task, if the server includes one"""
+    for field in ('torrentHash', 'infoHash', 'infoHashV1', 'infoHashV2', 'infohash_v1', 'infohash_v2'):
+        value = getattr(status, field, None)
+        if value:
+            return value
+    return None
+
+
+def _parse_qbit_version(version: str) -> Tuple[int, int]:
+    """
+    Parse the major and minor numbers from a qBittorrent version string
+    
+    Args:
+        version: Version as reported by the Web API, e.g. "v5.0.1" or "5.1.0beta1"
+        
+    Returns:
+        Tuple of (major, minor), with 0 for any part that is not a number
+    """
+    match = _VERSION_RE.match(version.strip())
+    if not match:
+        return 0, 0
+    return int(match.group(1)), int(match.group(2) or 0)
+
+
+def _task_status(status) -> Optional[TaskStatus]:
+    """TaskStatus of a creator task status entry, or None for a state qbittorrentapi does not know"""
+    try:
+        return TaskStatus(status.status)
+    except ValueError:
+        logger.warning("Unknown status %r for torrent creation task %s", status.status, status.taskID)
+        return None
+
+
+class _StatusPoller:
+    """Polls the status of all pending torrent creation tasks with one request per interval"""
+    
+    def __init__(self, fetch, max_interval: float):
+        """
+        Args:
+            fetch: Coroutine function returning the status of every task on the server
+            max_interval: Longest delay between two polls, in seconds
+        """
+        self._fetch = fetch
+        self._max_interval = max_interval
+        # task ID -> future resolved with the final status
+        self._pending: Dict[str, asyncio.Future] = {}
+        # Background coroutine, running only while tasks are pending
+        self._task: Optional[asyncio.Task] = None
+        # Set when a task is added, so a poller deep into its backoff checks it promptly
+        self._wakeup: Optional[asyncio.Event] = None
+    
+    async def wait_for(self, task_id: str, timeout: float):
+        """
+        Wait until a torrent creation task has finished or failed
+        
+        Args:
+            task_id: ID of the torrent creation task
+            timeout: Seconds to wait before giving up
+            
+        Returns:
+            Final task status, or None if the task did not complete in time
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._pending[task_id] = future
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        else:
+            self._wakeup.set()
+        
+        try:
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._pending.pop(task_id, None)
+    
+    def set_max_interval(self, max_interval: float):
+        """Change the longest delay between two polls; a running poller uses it from its next poll"""
+        self._max_interval = max_interval
+    
+    def stop(self):
+        """Stop polling; tasks still being waited for fail with an error so callers can clean up"""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        self._fail_pending(Exception("Status polling stopped before the task completed"))
+        self._pending.clear()
+    
+    def _fail_pending(self, error: Exception):
+        """Fail every task still being waited for with error"""
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+    
+    async def _run(self):
+        """Poll in the background; an unexpected error fails the waiters instead of leaving them hanging"""
+        try:
+            await self._poll()
+        except Exception as e:
+            logger.error("Torrent creation status polling failed: %s", e)
+            self._fail_pending(e)
+    
+    async def _poll(self):
+        """Poll until no tasks are pending, resolving the futures of completed ones"""
+        delay = _POLL_INITIAL_DELAY
+        failures = 0
+        
+        while self._pending:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), delay)
+            except asyncio.TimeoutError:
+                pass
+            else:
+                # A new task was added - start again from the short initial delay
+                self._wakeup.clear()
+                delay = _POLL_INITIAL_DELAY
+                continue
+            
+            try:
+                statuses = await self._fetch()
+            except Exception as e:
+                # One failed request should not abort every task in a batch; each
+                # waiter's own timeout still applies while the poller retries
+                failures += 1
+                if failures >= _POLL_MAX_FAILURES:
+                    self._fail_pending(e)
+                    return
+                logger.warning("Polling torrent creation status failed (%s), retrying", e)
+                delay = self._max_interval
+                continue
+            failures = 0
+            
+            # Back off towards the configured interval so small torrents finish
+            # quickly and long ones do not flood the Web API
+            delay = min(delay * _POLL_BACKOFF, self._max_interval)
+            
+            for status in statuses:
+                future = self._pending.get(status.taskID)
+                if future is None:
+                    continue
+                task_status = _task_status(status)
+                if task_status is None:
+                    continue
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Task %s status: %s", status.taskID, task_status.value)
+                
+                if task_status in (TaskStatus.FINISHED, TaskStatus.FAILED):
+                    if not future.done():
+                        future.set_result(status)
+
 
 class TorrentManager:
     """Manages torrent creation using qBittorrent v5.0.0+ Torrent Creator API"""
@@ -23,22 +411,83 @@ class TorrentManager:
         self.config = config
         self.config_manager = config_manager
         self._qbit_client = None
+        self._client_key: Optional[Tuple[str, str, str]] = None
+        # Monotonic time of the last successful qBittorrent call
+        self._last_used = 0.0
+        # (client, version, webapi_version, major, minor) - fixed for the server behind a client
+        self._version_cache: Optional[Tuple[Any, str, str, int, int]] = None
         self._credential_manager = CredentialManager()
+        # ref -> (value, time read); decrypting from the store on every call is wasteful
+        self._cred_cache: Dict[str, Tuple[Optional[str], float]] = {}
+        # (path, st_mtime_ns, st_size) -> SHA-1 of saved .torrent files, least recently used first;
+        # hashing runs in worker threads, so access goes through the lock
+        self._hash_cache: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+        self._hash_cache_lock = threading.Lock()
+        # Shared status polling for all creation tasks started by this manager
+        self._status_poller = _StatusPoller(
+            self._fetch_task_statuses,
+            config.torrent_creation.poll_interval or 2
+        )
+        # (time, message) of the last failed pre-flight check, so bulk operations fail fast
+        self._qbit_client_error: Optional[Tuple[float, str]] = None
+        # Trackers from credentials/config, resolved on first use (see invalidate_defaults)
+        self._default_trackers: Optional[List[str]] = None
+        self._default_url_seeds: List[str] = list(config.torrent_creation.url_seeds or ())
         
         # Initialize Docker path mapper - get mappings from qbittorrent.docker_path_mapping
         qbit_config = getattr(config, 'qbittorrent', None)
-        print(f"DEBUG: qbit_config = {qbit_config}")
-        if qbit_config and hasattr(qbit_config, 'docker_path_mapping'):
-            docker_mapping = qbit_config.docker_path_mapping or {}
-            print(f"DEBUG: Found docker_path_mapping in qbittorrent config: {docker_mapping}")
+        logger.debug("qbit_config = %s", qbit_config)
+        docker_mapping = _docker_mapping(config)
+        logger.debug("Final docker_mapping passed to DockerPathMapper: %s", docker_mapping)
+        self._path_mapper = DockerPathMapper(docker_mapping)
+        # Source paths are often mapped repeatedly (e.g. several episodes of a season);
+        # without mappings the mapper returns paths unchanged, so there is nothing to cache
+        if self._path_mapper.path_mapping:
+            self._host_to_container = lru_cache(maxsize=256)(self._path_mapper.host_to_container)
         else:
-            # Fallback to top-level docker_mapping for backward compatibility
-            docker_mapping_config = getattr(config, 'docker_mapping', {}) or {}
-            docker_mapping = docker_mapping_config.get('mappings', {}) if docker_mapping_config else {}
-            print(f"DEBUG: Using fallback docker_mapping: {docker_mapping}")
+            self._host_to_container = self._path_mapper.host_to_container
+        self._host_export_dir = self._path_mapper.container_to_host(_CONTAINER_EXPORT_DIR)
         
-        print(f"DEBUG: Final docker_mapping passed to DockerPathMapper: {docker_mapping}")
-        self._path_mapper = DockerPathMapper(docker_mapping)
+        # Connection settings used on every call, resolved once
+        self._qbit = _ConnectionSpec.from_config(qbit_config) if qbit_config else None
+    
+    @classmethod
+    def get_shared(cls, config: AppConfig, config_manager=None) -> 'TorrentManager':
+        """
+        Get the TorrentManager shared by every caller using the same connection settings
+        
+        The shared manager is reused while the qBittorrent connection and Docker path
+        mapping stay the same; other settings are applied to it in place. When those
+        change, a new manager replaces it and the caller holding the old one is
+        responsible for cleaning it up.
+        
+        Args:
+            config: Application configuration
+            config_manager: Optional ConfigManager for the manager to use
+            
+        Returns:
+            A manager whose path mapper, credential cache and session are reused across calls
+        """
+        global _shared_manager
+        key = _shared_manager_key(config)
+        if _shared_manager is not None and _shared_manager[0] == key:
+            manager = _shared_manager[1]
+            if manager.config is not config:
+                manager._apply_config(config)
+            if config_manager is not None:
+                manager.config_manager = config_manager
+            return manager
+        
+        manager = cls(config, config_manager)
+        _shared_manager = (key, manager)
+        return manager
+    
+    def _apply_config(self, config: AppConfig):
+        """Pick up settings that do not need a new manager (see get_shared)"""
+        self.config = config
+        self._status_poller.set_max_interval(config.torrent_creation.poll_interval or 2)
+        self._default_url_seeds = list(config.torrent_creation.url_seeds or ())
+        self.invalidate_defaults()
     
     async def __aenter__(self):
         """Async context manager entry"""
@@ -50,54 +499,114 @@ class TorrentManager:
     
     async def cleanup(self):
         """Clean up resources, including qBittorrent client session"""
+        self._status_poller.stop()
+        
         if self._qbit_client:
+            client = self._qbit_client
+            self._invalidate_client()
             try:
-                self._qbit_client.auth_log_out()
-                print("🧹 Logged out from qBittorrent session")
+                await self._call(client.auth_log_out)
+                logger.info("🧹 Logged out from qBittorrent session")
             except Exception as e:
-                print(f"Warning: Error during qBittorrent logout: {e}")
-            finally:
-                self._qbit_client = None
+                logger.warning("Error during qBittorrent logout: %s", e)
+    
+    async def _get_version(self, client) -> Tuple[str, str, int, int]:
+        """Get (version, webapi_version, major, minor) for a client, querying the server only once"""
+        cached = self._version_cache
+        if cached is not None and cached[0] is client:
+            return cached[1:]
+        
+        # Independent requests - issue them concurrently
+        version_info, webapi_version = await asyncio.gather(
+            self._call(lambda: client.app.version),
+            self._call(lambda: client.app.webapiVersion)
+        )
+        major, minor = _parse_qbit_version(version_info)
+        self._version_cache = (client, version_info, webapi_version, major, minor)
+        return version_info, webapi_version, major, minor
+    
+    async def _call(self, fn, *args, **kwargs):
+        """Run a blocking qbittorrentapi call in a worker thread so the event loop stays free"""
+        result = await asyncio.to_thread(fn, *args, **kwargs)
+        self._last_used = time.monotonic()
+        return result
+    
+    def _invalidate_client(self):
+        """Forget the current client so the next call logs in again"""
+        if self._client_key is not None and _shared_clients.get(self._client_key) is self._qbit_client:
+            _shared_clients.pop(self._client_key, None)
+            _login_times.pop(self._client_key, None)
+        self._qbit_client = None
+        self._client_key = None
     
     async def _get_qbit_client(self):
-        """Get or create qBittorrent client instance"""
+        """Get or create qBittorrent client instance, reusing a shared logged-in session"""
+        client = self._qbit_client
+        if client is not None and time.monotonic() - _login_times.get(self._client_key, 0.0) >= _SESSION_MAX_AGE:
+            # Long-lived managers keep their client; log in again before the server expires the session
+            logger.info("qBittorrent session is due to expire, logging in again")
+            self._invalidate_client()
+            client = None
+        if client is not None and time.monotonic() - self._last_used > _IDLE_PING_AFTER:
+            # The server or a proxy may have dropped an idle session - check cheaply before reuse
+            try:
+                await self._call(lambda: client.app.version)
+            except Exception as e:
+                logger.info("Idle qBittorrent session is no longer usable, reconnecting: %s", e)
+                self._invalidate_client()
+        
+        if self._qbit_client is None:
+            async with _client_lock():
+                return await self._connect_qbit_client()
+        return self._qbit_client
+    
+    async def _connect_qbit_client(self):
+        """Look up or create the shared client for the configured server and credentials"""
         if self._qbit_client is None:
             try:
-                # Get qBittorrent connection details
-                qbit_config = self.config.qbittorrent
-                
-                # Get credentials using new auth structure
-                username, password = self._resolve_credentials(qbit_config)
+                # Get credentials using the auth settings resolved in __init__
+                username, password = self._resolve_credentials()
                 
                 if not username or not password:
                     raise Exception("qBittorrent credentials not found. Please configure them in the Settings page.")
                 
-                # Build the URL with proper scheme support
-                scheme = 'https' if getattr(qbit_config, 'use_https', False) else 'http'
-                base_path = getattr(qbit_config, 'base_path', '') or ''
-                qbit_url = f"{scheme}://{qbit_config.host}:{qbit_config.port}{base_path}"
+                # URL (with scheme and base path) and connection settings resolved in __init__
+                qbit = self._qbit
+                qbit_url = qbit.url
                 
-                print(f"Connecting to qBittorrent at {qbit_url} with user: {username}")
+                # Reuse a session another manager already logged in with these settings
+                key = (qbit_url, username, password)
+                shared = _shared_clients.get(key)
+                if shared is not None and time.monotonic() - _login_times.get(key, 0.0) >= _SESSION_MAX_AGE:
+                    # The server may already have expired this session
+                    _shared_clients.pop(key, None)
+                    _login_times.pop(key, None)
+                    shared = None
+                if shared is not None:
+                    self._qbit_client = shared
+                    self._client_key = key
+                    return shared
                 
-                # Create client instance with production-ready configuration
-                verify_tls = getattr(qbit_config, 'verify_tls', True)
-                connection_timeout = getattr(qbit_config, 'connection_timeout', 10.0)
-                read_timeout = getattr(qbit_config, 'read_timeout', 30.0)
-                pool_connections = getattr(qbit_config, 'pool_connections', 10)
-                pool_maxsize = getattr(qbit_config, 'pool_maxsize', 10)
+                await self._preflight(qbit)
+                
+                logger.info("Connecting to qBittorrent at %s with user: %s", qbit_url, username)
                 
+                # Create client instance with production-ready configuration
                 self._qbit_client = qbittorrentapi.Client(
                     host=qbit_url,
                     username=username,
                     password=password,
-                    VERIFY_WEBUI_CERTIFICATE=verify_tls,
+                    VERIFY_WEBUI_CERTIFICATE=qbit.verify_tls,
                     # Production best practices from documentation
                     REQUESTS_ARGS={
-                        "timeout": (connection_timeout, read_timeout),  # (connect, read) timeouts
+                        "timeout": (qbit.connection_timeout, qbit.read_timeout),  # (connect, read) timeouts
                     },
                     HTTPADAPTER_ARGS={
-                        "pool_connections": pool_connections,
-                        "pool_maxsize": pool_maxsize,
+                        "pool_connections": qbit.pool_connections,
+                        "pool_maxsize": qbit.pool_maxsize,
+                        "max_retries": _HTTP_RETRY,
+                        # Wait for a pooled keep-alive connection instead of opening throwaway ones
+                        "pool_block": True,
                     },
                     RAISE_NOTIMPLEMENTEDERROR_FOR_UNIMPLEMENTED_API_ENDPOINTS=True,
                     RAISE_ERROR_FOR_UNSUPPORTED_QBITTORRENT_VERSIONS=False,
@@ -106,74 +615,121 @@ class TorrentManager:
                 
                 # Test connection with proper exception handling
                 try:
-                    self._qbit_client.auth_log_in()
-                    print("✅ Successfully authenticated with qBittorrent")
-                except qba_exc.LoginFailed:
-                    raise Exception("❌ Authentication failed. Please check your qBittorrent credentials.")
-                except qba_exc.Forbidden403Error:
-                    raise Exception("❌ IP address is banned from qBittorrent due to failed authentication attempts. Please wait or restart qBittorrent.")
-                except qba_exc.Unauthorized401Error:
-                    raise Exception("❌ Unauthorized. Please check your qBittorrent credentials and ensure Web UI is enabled.")
+                    await self._call(self._qbit_client.auth_log_in)
+                    logger.info("Successfully authenticated with qBittorrent")
+                    _shared_clients[key] = self._qbit_client
+                    _login_times[key] = time.monotonic()
+                    self._client_key = key
+                except _AUTH_ERRORS as e:
+                    raise Exception(_auth_error_message(e))
                 except qba_exc.APIConnectionError as e:
                     raise Exception(f"❌ Cannot connect to qBittorrent Web UI at {qbit_url}. Error: {e}")
                 
             except qba_exc.APIConnectionError as e:
-                print(f"Connection error to qBittorrent: {e}")
+                logger.error("Connection error to qBittorrent: %s", e)
                 self._qbit_client = None
                 raise Exception(f"Failed to connect to qBittorrent Web UI at {qbit_url}: {e}")
                 
             except Exception as e:
-                print(f"Failed to connect to qBittorrent: {e}")
+                logger.error("Failed to connect to qBittorrent: %s", e)
                 self._qbit_client = None
                 raise
         
         return self._qbit_client
     
-    def _resolve_credentials(self, qbit_config) -> tuple[Optional[str], Optional[str]]:
+    async def _preflight(self, qbit: _ConnectionSpec):
+        """Check that the Web UI port accepts connections before paying for a login"""
+        failed = self._qbit_client_error
+        if failed is not None and time.monotonic() - failed[0] < _PREFLIGHT_FAILURE_TTL:
+            raise Exception(failed[1])
+        
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(qbit.host, qbit.port),
+                timeout=min(qbit.connection_timeout, _PREFLIGHT_TIMEOUT)
+            )
+        except (OSError, asyncio.TimeoutError) as e:
+            # Keep only the message: re-raising one exception instance would keep
+            # growing its traceback and chain it into unrelated callers
+            message = f"❌ Cannot connect to qBittorrent Web UI at {qbit.url}. Error: {str(e) or 'connection timed out'}"
+            self._qbit_client_error = (time.monotonic(), message)
+            raise Exception(message)
+        
+        self._qbit_client_error = None
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except OSError:
+            pass
+    
+    def _cached_cred(self, ref: str) -> Optional[str]:
+        """Read a credential from the secure store, reusing it for up to _CREDENTIAL_TTL seconds"""
+        now = time.monotonic()
+        cached = self._cred_cache.get(ref)
+        if cached is not None and now - cached[1] < _CREDENTIAL_TTL:
+            return cached[0]
+        
+        value = self._credential_manager.get_credential(ref)
+        self._cred_cache[ref] = (value, now)
+        return value
+    
+    def clear_credential_cache(self):
+        """Forget cached credentials, e.g. after they were changed in the Settings page"""
+        self._cred_cache.clear()
+        self.invalidate_defaults()
+    
+    def invalidate_defaults(self):
+        """Resolve the default trackers again on the next torrent, e.g. after the tracker was edited"""
+        self._default_trackers = None
+    
+    def _get_default_trackers(self) -> List[str]:
+        """Trackers used when create_torrent is not given any, from credentials or config"""
+        if self._default_trackers is not None:
+            return self._default_trackers
+        
+        default_trackers = []
+        try:
+            # A direct read returns None when no tracker is stored
+            tracker_url = self._cached_cred('TRACKER')
+            if tracker_url:
+                default_trackers.append(tracker_url)
+        except Exception as e:
+            # Do not remember a result from a store that could not be read
+            logger.warning("Could not load tracker credentials: %s", e)
+            return list(self._qbit.trackers) if self._qbit else []
+        
+        # If no trackers from credentials, check config
+        if not default_trackers and self._qbit and self._qbit.trackers:
+            default_trackers = list(self._qbit.trackers)
+        
+        self._default_trackers = default_trackers
+        return default_trackers
+    
+    def _resolve_credentials(self) -> tuple[Optional[str], Optional[str]]:
         """Resolve qBittorrent credentials based on auth configuration"""
-        # Check if we have the new auth structure
-        auth_config = getattr(qbit_config, 'auth', None)
-        if auth_config:
-            auth_mode = auth_config.get('mode', 'secret')
-            if auth_mode == 'plain':
-                # Use plain credentials from config
-                username = auth_config.get('username', '')
-                password = auth_config.get('password', '')
-                print(f"DEBUG: Using plain auth - username: {username}, password: {'***' if password else 'empty'}")
-                return username, password
-            else:
-                # Use secret references
-                username_ref = auth_config.get('username_ref', 'QBIT_USERNAME')
-                password_ref = auth_config.get('password_ref', 'QBIT_PASSWORD')
-                username = self._credential_manager.get_credential(username_ref)
-                password = self._credential_manager.get_credential(password_ref)
-                print(f"DEBUG: Using secret auth - refs: {username_ref}/{password_ref}, resolved: {username}/{'***' if password else 'empty'}")
-                return username, password
-        
-        # Fallback to legacy structure
-        auth_mode = getattr(qbit_config, 'auth_mode', 'secret')
-        if auth_mode == 'plain':
-            username = getattr(qbit_config, 'username', '')
-            password = getattr(qbit_config, 'password', '')
-            print(f"DEBUG: Using legacy plain auth - username: {username}, password: {'***' if password else 'empty'}")
-            return username, password
-        else:
-            # Use secret references with fallback to defaults
-            username_ref = getattr(qbit_config, 'username_ref', 'QBIT_USERNAME')
-            password_ref = getattr(qbit_config, 'password_ref', 'QBIT_PASSWORD')
-            username = self._credential_manager.get_credential(username_ref)
-            password = self._credential_manager.get_credential(password_ref)
-            print(f"DEBUG: Using legacy secret auth - refs: {username_ref}/{password_ref}, resolved: {username}/{'***' if password else 'empty'}")
+        spec = self._qbit
+        if spec is None:
+            # No qbittorrent section - fall back to the default credential references
+            return self._cached_cred('QBIT_USERNAME'), self._cached_cred('QBIT_PASSWORD')
+        
+        if spec.auth_mode == 'plain':
+            # Use plain credentials from config
+            username, password = spec.plain_username, spec.plain_password
+            logger.debug("Using plain auth - username: %s, password: %s", username, '***' if password else 'empty')
             return username, password
+        
+        # Use secret references
+        username = self._cached_cred(spec.username_ref)
+        password = self._cached_cred(spec.password_ref)
+        logger.debug("Using secret auth - refs: %s/%s, resolved: %s/%s",
+                     spec.username_ref, spec.password_ref, username, '***' if password else 'empty')
+        return username, password
     
     async def test_connection(self) -> tuple[bool, str]:
         """Test qBittorrent connection"""
         try:
-            # Get qBittorrent connection details
-            qbit_config = self.config.qbittorrent
-            
-            # Get credentials using new auth structure
-            username, password = self._resolve_credentials(qbit_config)
+            # Get credentials using the auth settings resolved in __init__
+            username, password = self._resolve_credentials()
             
             if not username or not password:
                 missing = []
@@ -186,17 +742,10 @@ class TorrentManager:
             
             client = await self._get_qbit_client()
             
-            # Get qBittorrent version info
-            version_info = client.app.version
-            webapi_version = client.app.webapiVersion
+            # Get qBittorrent version info (fetched once per client)
+            version_info, webapi_version, major_version, minor_version = await self._get_version(client)
             
             # Check if torrent creator API is supported (v5.0.0+)
-            version_parts = version_info.split('.')
-            # Handle version strings that might start with 'v' (e.g., "v5.0.1")
-            major_part = version_parts[0].lstrip('v') if len(version_parts) > 0 else '0'
-            major_version = int(major_part) if major_part.isdigit() else 0
-            minor_version = int(version_parts[1]) if len(version_parts) > 1 and version_parts[1].isdigit() else 0
-            
             torrent_creator_supported = major_version >= 5
             
             message = f"Connected to qBittorrent {version_info}"
@@ -210,12 +759,9 @@ class TorrentManager:
             
             return True, message
             
-        except qba_exc.LoginFailed:
-            return False, "❌ Authentication failed. Please check your qBittorrent credentials."
-        except qba_exc.Forbidden403Error:
-            return False, "❌ IP address is banned from qBittorrent due to failed authentication attempts. Please wait or restart qBittorrent."
-        except qba_exc.Unauthorized401Error:
-            return False, "❌ Unauthorized. Please check your qBittorrent credentials and ensure Web UI is enabled."
+        except _AUTH_ERRORS as e:
+            self._invalidate_client()
+            return False, _auth_error_message(e)
         except qba_exc.APIConnectionError as e:
             return False, f"❌ Cannot connect to qBittorrent Web UI. Error: {e}"
         except qba_exc.UnsupportedQbittorrentVersion as e:
@@ -260,23 +806,7 @@ class TorrentManager:
             Dictionary with success status and details
         """
         try:
-            # Check if credentials are available first
-            username = self._credential_manager.get_credential('QBIT_USERNAME')
-            password = self._credential_manager.get_credential('QBIT_PASSWORD')
-            
-            if not username or not password:
-                missing = []
-                if not username:
-                    missing.append('QBIT_USERNAME')
-                if not password:
-                    missing.append('QBIT_PASSWORD')
-                
-                return {
-                    "success": False,
-                    "error": f"Missing qBittorrent credentials: {', '.join(missing)}",
-                    "message": "Please configure qBittorrent credentials in the Settings page"
-                }
-            
+            # Credentials are resolved and checked when the (shared) client logs in
             client = await self._get_qbit_client()
             
             # Extract name from path for torrent naming
@@ -284,7 +814,6 @@ class TorrentManager:
             
             # Resolve parameters from config if not provided
             torrent_config = self.config.torrent_creation
-            qbit_config = self.config.qbittorrent
             
             # Use provided values or fall back to config defaults
             final_private = private if private is not None else torrent_config.private
@@ -302,62 +831,43 @@ class TorrentManager:
                 else:
                     final_comment = f"Source: {source}"
             
-            print(f"Creating torrent with parameters:")
-            print(f"  - Source: {source_name} {'(Source: ' + source + ')' if source else ''}")
-            print(f"  - Private: {final_private}")
-            print(f"  - Start seeding: {final_start_seeding}")
-            print(f"  - Format: {final_format}")
-            print(f"  - Piece size: {final_piece_size}")
-            print(f"  - Optimize alignment: {final_optimize_alignment}")
-            print(f"  - Padded file size limit: {final_padded_file_size_limit}")
-            print(f"  - Comment: {final_comment}")
+            # Only format the parameter summary when it will actually be emitted
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Creating torrent with parameters:\n"
+                    "  - Source: %s %s\n"
+                    "  - Private: %s\n"
+                    "  - Start seeding: %s\n"
+                    "  - Format: %s\n"
+                    "  - Piece size: %s\n"
+                    "  - Optimize alignment: %s\n"
+                    "  - Padded file size limit: %s\n"
+                    "  - Comment: %s",
+                    source_name, f"(Source: {source})" if source else '',
+                    final_private, final_start_seeding, final_format, final_piece_size,
+                    final_optimize_alignment, final_padded_file_size_limit, final_comment,
+                )
             
             # Convert host path to container path for qBittorrent
-            container_source_path = self._path_mapper.host_to_container(source_path)
+            container_source_path = self._host_to_container(source_path)
             
-            print(f"Host path: {source_path}")
-            print(f"Container path: {container_source_path}")
+            logger.debug("Host path: %s", source_path)
+            logger.debug("Container path: %s", container_source_path)
             
             if container_source_path != source_path:
-                print(f"✅ Using Docker path mapping: {source_path} -> {container_source_path}")
+                logger.info("✅ Using Docker path mapping: %s -> %s", source_path, container_source_path)
             else:
-                print("⚠️  No Docker path mapping found - using original path")
+                logger.info("⚠️  No Docker path mapping found - using original path")
             
-            # Resolve trackers - use provided trackers or get from credentials/config
-            final_trackers = []
-            if trackers:
-                final_trackers = trackers
-            else:
-                # Get trackers from credential manager
-                try:
-                    credential_details = self._credential_manager.get_credential_details()
-                    
-                    # Ensure credential_details is not None and is a dictionary
-                    if credential_details and isinstance(credential_details, dict):
-                        # Get tracker URLs from stored credentials
-                        for cred_key, details in credential_details.items():
-                            if cred_key == 'TRACKER' and details and isinstance(details, dict) and details.get('exists'):
-                                tracker_url = self._credential_manager.get_credential('TRACKER')
-                                if tracker_url:
-                                    final_trackers.append(tracker_url)
-                    else:
-                        print("Warning: credential_details is None or not a dictionary")
-                                
-                except Exception as e:
-                    print(f"Warning: Could not load tracker credentials: {e}")
-                
-                # If no trackers from credentials, check config
-                if not final_trackers and hasattr(self.config, 'qbittorrent') and self.config.qbittorrent.trackers:
-                    final_trackers = self.config.qbittorrent.trackers
-            
-            # Resolve URL seeds - use provided URL seeds or get from config
-            final_url_seeds = url_seeds if url_seeds else (torrent_config.url_seeds or [])
+            # Use provided trackers / URL seeds or the defaults from credentials/config
+            final_trackers = trackers if trackers else self._get_default_trackers()
+            final_url_seeds = url_seeds if url_seeds else self._default_url_seeds
             
-            print(f"  - Trackers: {final_trackers}")
-            print(f"  - URL seeds: {final_url_seeds}")
+            logger.info("  - Trackers: %s", final_trackers)
+            logger.info("  - URL seeds: %s", final_url_seeds)
             
             # Create torrent using qBittorrent's torrent creator API
-            print(f"Creating torrent for: {container_source_path}")
+            logger.info("Creating torrent for: %s", container_source_path)
             
             # Ensure format is one of the valid values
             if final_format == 'v1':
@@ -367,109 +877,98 @@ class TorrentManager:
             else:
                 torrent_format = 'hybrid'
             
-            print(f"Using torrent format: {torrent_format}")
+            logger.info("Using torrent format: %s", torrent_format)
+            
+            torrent_filename = f"{source_name}.torrent"
+            
+            # Parameters shared by both modes; only the output file differs
+            task_kwargs = dict(
+                source_path=container_source_path,
+                format=torrent_format,
+                start_seeding=final_start_seeding,
+                is_private=final_private,
+                optimize_alignment=final_optimize_alignment,
+                padded_file_size_limit=final_padded_file_size_limit,
+                piece_size=final_piece_size,
+                comment=final_comment,
+                trackers=final_trackers if final_trackers else None,
+                url_seeds=final_url_seeds if final_url_seeds else None
+            )
+            
+            if final_start_seeding:
+                # Option 1: Let qBittorrent handle everything - no torrent_file_path needed
+                logger.info("🎯 Using auto-seeding mode - qBittorrent will handle torrent file management")
+            else:
+                # Option 2: Save torrent file to a qBittorrent-accessible location
+                # Use qBittorrent's export directory or a known accessible path
+                if output_dir:
+                    container_output_dir = self._host_to_container(output_dir)
+                else:
+                    container_output_dir = _CONTAINER_EXPORT_DIR
+                
+                container_torrent_path = os.path.join(container_output_dir, torrent_filename)
+                task_kwargs['torrent_file_path'] = container_torrent_path
+                logger.info("💾 Saving torrent file to: %s", container_torrent_path)
             
             # Add torrent creation task using the correct API method with all parameters
             try:
-                if final_start_seeding:
-                    # Option 1: Let qBittorrent handle everything - no torrent_file_path needed
-                    print("🎯 Using auto-seeding mode - qBittorrent will handle torrent file management")
-                    task = client.torrentcreator.add_task(
-                        source_path=container_source_path,
-                        format=torrent_format,
-                        start_seeding=final_start_seeding,
-                        is_private=final_private,
-                        optimize_alignment=final_optimize_alignment,
-                        padded_file_size_limit=final_padded_file_size_limit,
-                        piece_size=final_piece_size,
-                        comment=final_comment,
-                        trackers=final_trackers if final_trackers else None,
-                        url_seeds=final_url_seeds if final_url_seeds else None
-                    )
-                else:
-                    # Option 2: Save torrent file to a qBittorrent-accessible location
-                    # Use qBittorrent's export directory or a known accessible path
-                    if output_dir:
-                        container_output_dir = self._path_mapper.host_to_container(output_dir)
-                    else:
-                        container_output_dir = "/data/downloads/torrents/qbittorrent/files"  # qBittorrent's export dir
-                    
-                    torrent_filename = f"{source_name}.torrent"
-                    container_torrent_path = os.path.join(container_output_dir, torrent_filename)
-                    
-                    print(f"💾 Saving torrent file to: {container_torrent_path}")
-                    task = client.torrentcreator.add_task(
-                        source_path=container_source_path,
-                        torrent_file_path=container_torrent_path,
-                        format=torrent_format,
-                        start_seeding=final_start_seeding,
-                        is_private=final_private,
-                        optimize_alignment=final_optimize_alignment,
-                        padded_file_size_limit=final_padded_file_size_limit,
-                        piece_size=final_piece_size,
-                        comment=final_comment,
-                        trackers=final_trackers if final_trackers else None,
-                        url_seeds=final_url_seeds if final_url_seeds else None
-                    )
-            except qba_exc.Conflict409Error:
+                task = await self._add_task_with_retry(client, task_kwargs)
+            except _Conflict:
                 return {
                     "success": False,
                     "error": "Too many torrent creation tasks running. Please wait for existing tasks to complete.",
                     "message": "qBittorrent is busy with other torrent creation tasks. Try again in a moment."
                 }
-            except qba_exc.NotFound404Error:
+            except _NotFound:
                 return {
                     "success": False,
                     "error": f"Source path not found: {container_source_path}",
                     "message": f"qBittorrent cannot access the source path: {container_source_path}"
                 }
             except Exception as e:
-                print(f"Failed to create torrent task: {e}")
-                # Try with minimal parameters as fallback
-                print("Trying with minimal parameters...")
-                try:
-                    task = client.torrentcreator.add_task(
-                        source_path=container_source_path
-                    )
-                except qba_exc.Conflict409Error:
-                    return {
-                        "success": False,
-                        "error": "Too many torrent creation tasks running. Please wait for existing tasks to complete.",
-                        "message": "qBittorrent is busy with other torrent creation tasks. Try again in a moment."
-                    }
-                except Exception as e2:
-                    return {
-                        "success": False,
-                        "error": f"Failed to create torrent task: {e2}",
-                        "message": f"Could not create torrent for {source_path}"
-                    }
+                logger.warning("Failed to create torrent task: %s", e)
+                return {
+                    "success": False,
+                    "error": f"Failed to create torrent task: {e}",
+                    "message": f"Could not create torrent for {source_path}"
+                }
             
             # Wait for task completion
             task_id = task.taskID
-            print(f"Torrent creation task started: {task_id}")
-            
-            # Poll task status until completion
-            max_wait_time = 300  # 5 minutes max
-            poll_interval = 2    # Check every 2 seconds
-            elapsed_time = 0
+            logger.info("Torrent creation task started: %s", task_id)
             
-            while elapsed_time < max_wait_time:
-                await asyncio.sleep(poll_interval)
-                elapsed_time += poll_interval
-                
-                # Get task status using the correct API method
-                status = task.status()
-                task_status = TaskStatus(status.status)
+            # Wait for the shared poller to report the task as finished or failed
+            max_wait_time = torrent_config.timeout or 300
+            try:
+                status = await self._status_poller.wait_for(task_id, max_wait_time)
+            except Exception as poll_error:
+                # Status unknown - remove the task rather than leave it behind in qBittorrent
+                logger.error("Could not get status of task %s: %s", task_id, poll_error)
+                if isinstance(poll_error, _AUTH_ERRORS):
+                    self._invalidate_client()
+                try:
+                    await self._call(task.delete)
+                    logger.info("🧹 Cleaned up torrent creation task %s", task_id)
+                except Exception as cleanup_error:
+                    logger.warning("Could not cleanup task %s: %s", task_id, cleanup_error)
                 
-                print(f"Task status: {task_status.value}")
+                return {
+                    "success": False,
+                    "error": f"Torrent creation failed: {poll_error}",
+                    "task_id": task_id,
+                    "message": f"Could not create torrent for {source_path}"
+                }
+            
+            if status is not None:
+                task_status = _task_status(status)
                 
                 if task_status == TaskStatus.FINISHED:
                     # Task completed successfully
-                    print("Torrent creation completed successfully!")
+                    logger.info("Torrent creation completed successfully!")
                     
                     if start_seeding:
                         # qBittorrent handled everything - torrent is already added and seeding
-                        print("🚀 Torrent automatically added to qBittorrent and seeding started!")
+                        logger.info("🚀 Torrent automatically added to qBittorrent and seeding started!")
                         
                         # For auto-seeding mode, we don't need to save a file locally
                         # The torrent is managed entirely by qBittorrent
@@ -478,50 +977,51 @@ class TorrentManager:
                         
                         # Try to get the hash from qBittorrent if possible
                         try:
-                            # Get recent torrents to find our newly added one
-                            torrents = client.torrents_info(limit=10, sort='added_on', reverse=True)
-                            for torrent in torrents:
-                                if source_name in torrent.name:
-                                    torrent_hash = torrent.hash
-                                    print(f"🔍 Found torrent in qBittorrent: {torrent.name} (Hash: {torrent_hash})")
-                                    break
+                            task_hash = _status_info_hash(status)
+                            if task_hash:
+                                # The finished task already reports the info hash
+                                torrent_hash = task_hash
+                                logger.info("🔍 Torrent hash reported by qBittorrent: %s", torrent_hash)
+                            else:
+                                # Get recent torrents to find our newly added one
+                                torrents = await self._call(client.torrents_info, limit=10, sort='added_on', reverse=True)
+                                for torrent in torrents:
+                                    # Exact match, so similarly named torrents are not picked up
+                                    if torrent.name == source_name:
+                                        torrent_hash = torrent.hash
+                                        logger.info("🔍 Found torrent in qBittorrent: %s (Hash: %s)", torrent.name, torrent_hash)
+                                        break
                         except Exception as e:
-                            print(f"Warning: Could not retrieve torrent hash from qBittorrent: {e}")
+                            logger.warning("Could not retrieve torrent hash from qBittorrent: %s", e)
                     
                     else:
                         # Check if torrent file was saved to the specified location
                         # Map back to host path for the response
-                        torrent_filename = f"{source_name}.torrent"
-                        
                         # The file was saved to qBittorrent's export directory
-                        # Map the container path back to host path if possible
-                        container_export_dir = "/data/downloads/torrents/qbittorrent/files"
-                        host_export_dir = self._path_mapper.container_to_host(container_export_dir)
-                        torrent_path = os.path.join(host_export_dir, torrent_filename)
+                        # (mapped back to a host path in __init__)
+                        torrent_path = os.path.join(self._host_export_dir, torrent_filename)
                         
-                        print(f"💾 Torrent file should be available at: {torrent_path}")
+                        logger.info("💾 Torrent file should be available at: %s", torrent_path)
                         
                         # Try to calculate hash from saved file
                         try:
-                            if os.path.exists(torrent_path):
-                                with open(torrent_path, 'rb') as f:
-                                    torrent_data = f.read()
-                                import hashlib
-                                torrent_hash = hashlib.sha1(torrent_data).hexdigest()
-                                print(f"✅ Torrent file found and hash calculated: {torrent_hash}")
+                            file_hash = await asyncio.to_thread(self._torrent_file_hash, torrent_path)
+                            if file_hash is not None:
+                                torrent_hash = file_hash
+                                logger.info("✅ Torrent file found and hash calculated: %s", torrent_hash)
                             else:
-                                print(f"⚠️  Torrent file not found at expected location: {torrent_path}")
+                                logger.warning("Torrent file not found at expected location: %s", torrent_path)
                                 torrent_hash = "file-not-accessible"
                         except Exception as e:
-                            print(f"Warning: Could not access torrent file: {e}")
+                            logger.warning("Could not access torrent file: %s", e)
                             torrent_hash = "unknown"
                     
                     # Clean up task using the correct API method
                     try:
-                        task.delete()
-                        print(f"🧹 Cleaned up torrent creation task {task_id}")
+                        await self._call(task.delete)
+                        logger.info("🧹 Cleaned up torrent creation task %s", task_id)
                     except Exception as cleanup_error:
-                        print(f"Warning: Could not cleanup task {task_id}: {cleanup_error}")
+                        logger.warning("Could not cleanup task %s: %s", task_id, cleanup_error)
                     
                     return {
                         "success": True,
@@ -536,14 +1036,14 @@ class TorrentManager:
                     # Task failed
                     error_msg = getattr(status, 'errorMessage', 'Unknown error')
                     
-                    print(f"Task failed with error: {error_msg}")
-                    print(f"Full status object: {status}")
+                    logger.error("Task failed with error: %s", error_msg)
+                    logger.debug("Full status object: %s", status)
                     
                     try:
-                        task.delete()
-                        print(f"🧹 Cleaned up failed task {task_id}")
+                        await self._call(task.delete)
+                        logger.info("🧹 Cleaned up failed task %s", task_id)
                     except Exception as cleanup_error:
-                        print(f"Warning: Could not cleanup failed task {task_id}: {cleanup_error}")
+                        logger.warning("Could not cleanup failed task %s: %s", task_id, cleanup_error)
                     
                     return {
                         "success": False,
@@ -553,12 +1053,12 @@ class TorrentManager:
                     }
             
             # Timeout reached
-            print(f"⏰ Torrent creation timed out after {max_wait_time} seconds")
+            logger.warning("⏰ Torrent creation timed out after %s seconds", max_wait_time)
             try:
-                task.delete()
-                print(f"🧹 Cleaned up timed-out task {task_id}")
+                await self._call(task.delete)
+                logger.info("🧹 Cleaned up timed-out task %s", task_id)
             except Exception as cleanup_error:
-                print(f"Warning: Could not cleanup timed-out task {task_id}: {cleanup_error}")
+                logger.warning("Could not cleanup timed-out task %s: %s", task_id, cleanup_error)
                 
             return {
                 "success": False,
@@ -568,6 +1068,9 @@ class TorrentManager:
             }
             
         except Exception as e:
+            if isinstance(e, (qba_exc.LoginFailed, qba_exc.Unauthorized401Error)):
+                # Session is no longer valid - log in afresh on the next call
+                self._invalidate_client()
             error_msg = str(e)
             return {
                 "success": False,
@@ -575,6 +1078,106 @@ class TorrentManager:
                 "message": f"Could not create torrent for {source_path}"
             }
     
+    async def _add_task_with_retry(self, client, task_kwargs: Dict[str, Any]):
+        """
+        Add a torrent creation task, retrying transient failures with all parameters kept
+        
+        addTask is not idempotent, so only failures where the server cannot have queued
+        the task are retried: connect errors, 429, and 503 with Retry-After. Read timeouts
+        and dropped connections are raised, as a retry could create a duplicate task.
+        
+        Args:
+            client: Logged-in qBittorrent client
+            task_kwargs: Keyword arguments for torrentcreator.add_task
+            
+        Returns:
+            The created task
+        """
+        for attempt in range(_ADD_TASK_ATTEMPTS):
+            try:
+                return await self._call(client.torrentcreator.add_task, **task_kwargs)
+            except qba_exc.APIConnectionError as e:
+                retry_after = None
+                if isinstance(e, qba_exc.HTTPError):
+                    status_code = getattr(e, 'http_status_code', None)
+                    if status_code == 503:
+                        retry_after = _retry_after(e)
+                    retryable = status_code == 429 or retry_after is not None
+                else:
+                    retryable = _connect_failed(e)
+                if not retryable or attempt == _ADD_TASK_ATTEMPTS - 1:
+                    raise
+                if retry_after is not None:
+                    delay = retry_after
+                else:
+                    delay = random.uniform(0.5, 1.5) * _ADD_TASK_RETRY_DELAY * 2 ** attempt
+                logger.warning("Adding torrent creation task failed (%s), retrying in %.1fs", e, delay)
+                await asyncio.sleep(delay)
+    
+    async def _fetch_task_statuses(self):
+        """Status of every torrent creation task on the server, in one request"""
+        client = await self._get_qbit_client()
+        # Without a task ID the endpoint returns every task in one payload
+        return await self._call(client.torrentcreator.status)
+    
+    async def create_torrents(
+        self,
+        jobs: List[Dict[str, Any]],
+        max_concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Create several torrents concurrently
+        
+        Args:
+            jobs: Keyword arguments for create_torrent, one dict per torrent
+            max_concurrency: Maximum number of simultaneous creation tasks
+                (defaults to qbittorrent.max_concurrent_tasks)
+            
+        Returns:
+            Result dictionaries in the same order as jobs
+        """
+        if max_concurrency is None:
+            max_concurrency = getattr(self.config.qbittorrent, 'max_concurrent_tasks', 4) or 4
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _create_one(job: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.create_torrent(**job)
+        
+        tasks = [asyncio.create_task(_create_one(job)) for job in jobs]
+        return await asyncio.gather(*tasks)
+    
+    def _torrent_file_hash(self, torrent_path: str) -> Optional[str]:
+        """
+        Hash a saved .torrent file, reusing the result while the file is unchanged
+        
+        Args:
+            torrent_path: Host path of the .torrent file
+            
+        Returns:
+            Hex SHA-1 of the file, or None if it does not exist
+        """
+        # Open first and stat the descriptor, so a missing file costs one syscall
+        # and the cache key always describes the file that is actually hashed
+        try:
+            with open(torrent_path, 'rb', buffering=_HASH_CHUNK_SIZE) as f:
+                st = os.fstat(f.fileno())
+                key = (torrent_path, st.st_mtime_ns, st.st_size)
+                with self._hash_cache_lock:
+                    cached = self._hash_cache.get(key)
+                    if cached is not None:
+                        self._hash_cache.move_to_end(key)
+                        return cached
+                
+                file_hash = _hash_stream(f)
+                with self._hash_cache_lock:
+                    self._hash_cache[key] = file_hash
+                    if len(self._hash_cache) > _HASH_CACHE_MAXSIZE:
+                        self._hash_cache.popitem(last=False)
+                return file_hash
+        except FileNotFoundError:
+            return None
+    
     async def get_torrent_file_bytes(self, task_id: str) -> Optional[bytes]:
         """
         Retrieve .torrent file bytes for a completed task
@@ -587,16 +1190,16 @@ class TorrentManager:
         """
         try:
             client = await self._get_qbit_client()
-            torrent_bytes = client.torrentcreator.torrent_file(task_id=task_id)
+            torrent_bytes = await self._call(client.torrentcreator.torrent_file, task_id=task_id)
             return torrent_bytes
-        except qba_exc.Conflict409Error:
-            print(f"Task {task_id} not yet finished or failed")
+        except _Conflict:
+            logger.info("Task %s not yet finished or failed", task_id)
             return None
-        except qba_exc.NotFound404Error:
-            print(f"Task {task_id} not found")
+        except _NotFound:
+            logger.info("Task %s not found", task_id)
             return None
         except Exception as e:
-            print(f"Error retrieving torrent file bytes: {e}")
+            logger.error("Error retrieving torrent file bytes: %s", e)
             return None
     
     async def get_torrent_creation_status(self, task_id: str) -> Optional[Dict[str, Any]]:
@@ -611,7 +1214,7 @@ class TorrentManager:
         """
         try:
             client = await self._get_qbit_client()
-            status_list = client.torrentcreator.status(task_id=task_id)
+            status_list = await self._call(client.torrentcreator.status, task_id=task_id)
             
             if status_list and len(status_list) > 0:
                 status = status_list[0]
@@ -624,13 +1227,37 @@ class TorrentManager:
             else:
                 return None
                 
-        except qba_exc.NotFound404Error:
-            print(f"Task {task_id} not found")
+        except _NotFound:
+            logger.info("Task %s not found", task_id)
             return None
         except Exception as e:
-            print(f"Error getting task status: {e}")
+            logger.error("Error getting task status: %s", e)
             return None
     
+    @staticmethod
+    def _read_app_details(client) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Blocking read of build info and monitoring preferences, each empty if unavailable"""
+        # Get build info if available
+        try:
+            build_info = client.app.build_info
+        except Exception:
+            build_info = {}
+        
+        # Get preferences (limited subset for monitoring)
+        try:
+            prefs = client.app.preferences
+            monitoring_prefs = {
+                "web_ui_port": prefs.get("web_ui_port"),
+                "web_ui_https_enabled": prefs.get("web_ui_https_enabled"),
+                "dht": prefs.get("dht"),
+                "pex": prefs.get("pex"),
+                "lsd": prefs.get("lsd"),
+            }
+        except Exception:
+            monitoring_prefs = {}
+        
+        return build_info, monitoring_prefs
+    
     async def get_qbittorrent_info(self) -> Dict[str, Any]:
         """
         Get qBittorrent application information for monitoring
@@ -641,28 +1268,12 @@ class TorrentManager:
         try:
             client = await self._get_qbit_client()
             
-            # Get version information
-            version = client.app.version
-            web_api_version = client.app.web_api_version
-            
-            # Get build info if available
-            try:
-                build_info = client.app.build_info
-            except Exception:
-                build_info = {}
-            
-            # Get preferences (limited subset for monitoring)
-            try:
-                prefs = client.app.preferences
-                monitoring_prefs = {
-                    "web_ui_port": prefs.get("web_ui_port"),
-                    "web_ui_https_enabled": prefs.get("web_ui_https_enabled"),
-                    "dht": prefs.get("dht"),
-                    "pex": prefs.get("pex"),
-                    "lsd": prefs.get("lsd"),
-                }
-            except Exception:
-                monitoring_prefs = {}
+            # Version (fetched once per client) alongside build info and preferences,
+            # the latter two read in a single worker-thread hop
+            (version, web_api_version, _, _), (build_info, monitoring_prefs) = await asyncio.gather(
+                self._get_version(client),
+                self._call(self._read_app_details, client)
+            )
             
             return {
                 "version": version,
@@ -673,7 +1284,7 @@ class TorrentManager:
             }
             
         except Exception as e:
-            print(f"Error getting qBittorrent info: {e}")
+            logger.error("Error getting qBittorrent info: %s", e)
             return {
                 "error": str(e),
                 "torrent_creator_supported": False,
@@ -3,22 +3,26 @@ Secure Credential Manager
 Handles encryption and storage of sensitive configuration data
 """
 import os
+import re
 import json
 import hashlib
 from pathlib import Path
 from typing import Dict, Optional, Any
+from urllib.parse import urlparse
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
 
+from .file_utils import ensure_directory
+
 
 class CredentialManager:
     """Manages encrypted storage of sensitive credentials"""
     
     def __init__(self, credentials_file: str = "config/.credentials"):
         self.credentials_file = Path(credentials_file)
-        self.credentials_file.parent.mkdir(parents=True, exist_ok=True)
+        ensure_directory(self.credentials_file.parent)
         self._key = None
         
     def _get_machine_key(self) -> bytes:
@@ -83,7 +87,6 @@ class CredentialManager:
                 # Fallback to .env file for testing
                 try:
                     from dotenv import load_dotenv
-                    import os
                     
                     # Load .env file from config directory
                     env_path = Path(__file__).parent.parent.parent / "config" / ".env"
@@ -118,7 +121,6 @@ class CredentialManager:
             # Fallback to .env file for testing
             try:
                 from dotenv import load_dotenv
-                import os
                 
                 # Load .env file from config directory
                 env_path = Path(__file__).parent.parent.parent / "config" / ".env"
@@ -179,8 +181,6 @@ class CredentialManager:
         if not url or not isinstance(url, str):
             return ''
         
-        import re
-        
         # Pattern to match common tracker URL formats
         patterns = [
             # https://tracker.domain.com/PASSKEY/announce
@@ -196,7 +196,6 @@ class CredentialManager:
         
         # Fallback: just show the domain part
         try:
-            from urllib.parse import urlparse
             parsed = urlparse(url)
             return f"{parsed.scheme}://{parsed.netloc}/########{'#' * 8}/announce"
         except Exception:
@@ -331,12 +330,11 @@ class CredentialManager:
 class SecureConfigManager:
     """Enhanced config manager that uses encrypted credential storage"""
     
-    def __init__(self, config_path: str = "config/config.yaml"):
-        import sys
-        sys.path.append(str(Path(__file__).parent.parent))
-        from core.config_manager import ConfigManager
+    def __init__(self, config_path: str = "config/config.yaml", config_manager=None):
+        # Imported here because config_manager imports this module lazily as well
+        from ..core.config_manager import ConfigManager
         
-        self.config_manager = ConfigManager(config_path)
+        self.config_manager = config_manager or ConfigManager(config_path)
         self.credential_manager = CredentialManager()
         
         # Auto-migrate from .env if it exists
@@ -347,7 +345,6 @@ class SecureConfigManager:
         if not isinstance(text, str) or '${' not in text:
             return text
         
-        import re
         pattern = r'\$\{([^}]+)\}'
         
         def replace_var(match):
@@ -2,6 +2,7 @@
 Docker Path Mapping Utilities
 Handles translation between host and container paths for Docker deployments
 """
+import re
 from pathlib import Path
 from typing import Dict, Optional, Tuple, Union, List
 
@@ -25,6 +26,33 @@ class DockerPathMapper:
             key=lambda x: len(x[0]),
             reverse=True
         )
+        
+        # Resolve the host prefixes once (resolve() hits the filesystem) and keep
+        # (resolved host prefix, container prefix, configured host prefix), longest first
+        self._resolved_mappings = sorted(
+            ((str(Path(host).resolve()), container, host) for host, container in self.sorted_mappings),
+            key=lambda x: len(x[0]),
+            reverse=True
+        )
+        
+        # One regex alternation per direction: the first (longest) matching prefix wins
+        self._h2c_lookup: Dict[str, str] = {}
+        for resolved_host, container, _ in self._resolved_mappings:
+            self._h2c_lookup.setdefault(resolved_host, container)
+        self._h2c_re = self._prefix_regex(self._h2c_lookup)
+        
+        self._c2h_lookup: Dict[str, str] = {}
+        for host, container in sorted(self.sorted_mappings, key=lambda x: len(x[1]), reverse=True):
+            self._c2h_lookup.setdefault(container, host)
+        self._c2h_re = self._prefix_regex(self._c2h_lookup)
+    
+    @staticmethod
+    def _prefix_regex(prefixes) -> Optional["re.Pattern[str]"]:
+        """Compile a regex matching the longest of the given path prefixes"""
+        if not prefixes:
+            return None
+        ordered = sorted(prefixes, key=len, reverse=True)
+        return re.compile('|'.join(re.escape(prefix) for prefix in ordered))
     
     def host_to_container(self, host_path: str) -> str:
         """
@@ -42,15 +70,16 @@ class DockerPathMapper:
         host_path = str(Path(host_path).resolve())
         
         # Find the best matching mapping (longest path match)
-        for host_prefix, container_prefix in self.sorted_mappings:
-            host_prefix = str(Path(host_prefix).resolve())
-            if host_path.startswith(host_prefix):
-                # Replace the host prefix with container prefix
-                relative_path = host_path[len(host_prefix):].lstrip('/')
-                if relative_path:
-                    return f"{container_prefix.rstrip('/')}/{relative_path}"
-                else:
-                    return container_prefix.rstrip('/')
+        match = self._h2c_re.match(host_path)
+        if match:
+            host_prefix = match.group(0)
+            container_prefix = self._h2c_lookup[host_prefix]
+            # Replace the host prefix with container prefix
+            relative_path = host_path[len(host_prefix):].lstrip('/')
+            if relative_path:
+                return f"{container_prefix.rstrip('/')}/{relative_path}"
+            else:
+                return container_prefix.rstrip('/')
         
         # No mapping found, return original path
         return host_path
@@ -71,14 +100,16 @@ class DockerPathMapper:
         container_path = str(Path(container_path))
         
         # Find the best matching mapping (longest path match)
-        for host_prefix, container_prefix in self.sorted_mappings:
-            if container_path.startswith(container_prefix):
-                # Replace the container prefix with host prefix
-                relative_path = container_path[len(container_prefix):].lstrip('/')
-                if relative_path:
-                    return f"{host_prefix.rstrip('/')}/{relative_path}"
-                else:
-                    return host_prefix.rstrip('/')
+        match = self._c2h_re.match(container_path)
+        if match:
+            container_prefix = match.group(0)
+            host_prefix = self._c2h_lookup[container_prefix]
+            # Replace the container prefix with host prefix
+            relative_path = container_path[len(container_prefix):].lstrip('/')
+            if relative_path:
+                return f"{host_prefix.rstrip('/')}/{relative_path}"
+            else:
+                return host_prefix.rstrip('/')
         
         # No mapping found, return original path
         return container_path
@@ -97,13 +128,7 @@ class DockerPathMapper:
             return False
         
         host_path = str(Path(host_path).resolve())
-        
-        for host_prefix, _ in self.sorted_mappings:
-            host_prefix = str(Path(host_prefix).resolve())
-            if host_path.startswith(host_prefix):
-                return True
-        
-        return False
+        return self._h2c_re.match(host_path) is not None
     
     def get_mapped_roots(self) -> list:
         """
@@ -131,8 +156,7 @@ class DockerPathMapper:
         # Find which mapping rule was used
         mapping_rule = None
         if is_mapped:
-            for host_prefix, container_prefix in self.sorted_mappings:
-                host_prefix_resolved = str(Path(host_prefix).resolve())
+            for host_prefix_resolved, container_prefix, host_prefix in self._resolved_mappings:
                 if host_path_resolved.startswith(host_prefix_resolved):
                     mapping_rule = {
                         "host_prefix": host_prefix,
@@ -3,26 +3,26 @@ File utilities for folder information and file operations
 """
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Union, Tuple
+from typing import Dict, Any, List, Optional, Union, Tuple
+
+# Translation table for sanitize_filename: invalid characters become '_', control characters are removed
+_FILENAME_TRANSLATION = {
+    **{ord(c): '_' for c in '<>:"/\\|?*'},
+    **{code: None for code in range(32)},
+}
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
 
 
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human-readable format"""
-    if size_bytes == 0:
-        return "0 B"
-    
-    size_names = ["B", "KB", "MB", "GB", "TB"]
-    size = float(size_bytes)
-    i = 0
+    if size_bytes < 1024:
+        return f"{int(size_bytes)} B"
     
-    while size >= 1024.0 and i < len(size_names) - 1:
-        size /= 1024.0
-        i += 1
-    
-    if i == 0:
-        return f"{int(size)} {size_names[i]}"
-    else:
-        return f"{size:.1f} {size_names[i]} ({size_bytes:,} bytes)"
+    # Each unit step is 2**10, so the unit index follows directly from the bit length
+    i = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    size = size_bytes / (1 << (10 * i))
+    return f"{size:.1f} {_SIZE_UNITS[i]} ({size_bytes:,} bytes)"
 
 
 def get_folder_info(folder_path: Path) -> Dict[str, Any]:
@@ -75,19 +75,34 @@ def get_folder_info(folder_path: Path) -> Dict[str, Any]:
     file_count = 0
     folder_count = 0
     errors = []
+    stack: List[str] = [str(folder_path)]
     
     try:
-        for root, dirs, files in os.walk(folder_path):
-            folder_count += len(dirs)
+        # Explicit directory stack instead of os.walk: DirEntry caches the entry
+        # type from readdir, so only files need an extra stat() for their size
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError as e:
+                if directory == str(folder_path):
+                    raise
+                errors.append(f"Cannot access {os.path.basename(directory)}: {e}")
+                continue
             
-            for file in files:
-                file_count += 1
+            for entry in entries:
                 try:
-                    file_path = os.path.join(root, file)
-                    total_size += os.path.getsize(file_path)
-                except (OSError, IOError) as e:
-                    errors.append(f"Cannot access {file}: {e}")
-                    continue
+                    if entry.is_dir():
+                        folder_count += 1
+                        # Count symlinked directories like os.walk, but do not descend into them
+                        if not entry.is_symlink():
+                            stack.append(entry.path)
+                        continue
+                    file_count += 1
+                    total_size += entry.stat().st_size
+                except OSError as e:
+                    errors.append(f"Cannot access {entry.name}: {e}")
     
     except Exception as e:
         return {
@@ -116,12 +131,13 @@ def get_folder_info(folder_path: Path) -> Dict[str, Any]:
     return info
 
 
-def validate_folder_for_torrent(folder_path: Path) -> Tuple[bool, str]:
+def validate_folder_for_torrent(folder_path: Path, info: Optional[Dict[str, Any]] = None) -> Tuple[bool, str]:
     """
     Validate if a folder is suitable for torrent creation
     
     Args:
         folder_path: Path to validate
+        info: Result of get_folder_info for the path, computed if not given
         
     Returns:
         Tuple of (is_valid, message)
@@ -137,7 +153,8 @@ def validate_folder_for_torrent(folder_path: Path) -> Tuple[bool, str]:
         return False, "Cannot read the path (permission denied)"
     
     # Get basic info
-    info = get_folder_info(folder_path)
+    if info is None:
+        info = get_folder_info(folder_path)
     
     if info.get("error"):
         return False, str(info["error"])
@@ -156,6 +173,18 @@ def validate_folder_for_torrent(folder_path: Path) -> Tuple[bool, str]:
     return True, f"Valid folder with {file_count} files ({format_file_size(total_size)})"
 
 
+def ensure_directory(path: Union[str, Path]) -> None:
+    """
+    Create a directory (and parents) if it does not exist
+    
+    Args:
+        path: Directory to create if it does not exist
+    """
+    # Always ask the filesystem: a directory removed while the app runs is recreated,
+    # and makedirs with exist_ok costs a single stat when it already exists
+    os.makedirs(path, exist_ok=True)
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename for safe file system usage
@@ -166,13 +195,8 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
-    
-    # Remove control characters
-    filename = ''.join(c for c in filename if ord(c) >= 32)
+    # Replace invalid characters and drop control characters in a single pass
+    filename = filename.translate(_FILENAME_TRANSLATION)
     
     # Trim whitespace and dots
     filename = filename.strip(' .')
@@ -6,6 +6,9 @@ import sys
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
 
+# Arguments of the last setup_logging call, used to skip redundant reconfiguration
+_configured_with = None
+
 
 def setup_logging(verbose: bool = False, log_file: str = "log/app.log"):
     """
@@ -15,6 +18,10 @@ def setup_logging(verbose: bool = False, log_file: str = "log/app.log"):
         verbose: Enable verbose (DEBUG) logging
         log_file: Path to log file
     """
+    global _configured_with
+    if _configured_with == (verbose, log_file) and logging.getLogger().handlers:
+        return
+    
     # Create log directory if it doesn't exist
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
@@ -58,6 +65,8 @@ def setup_logging(verbose: bool = False, log_file: str = "log/app.log"):
     logging.getLogger('urllib3').setLevel(logging.WARNING)
     logging.getLogger('requests').setLevel(logging.WARNING)
     
+    _configured_with = (verbose, log_file)
+    
     if verbose:
         print(f"Logging setup complete. Log file: {log_file}")
 
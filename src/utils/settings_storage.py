@@ -5,11 +5,12 @@ Handles multi-layered configuration storage for UI frontend
 import json
 from typing import Dict, Any, Optional, Union
 from pathlib import Path
-from dataclasses import asdict
+from dataclasses import asdict, replace
 import logging
 
 from ..core.config_manager import ConfigManager, AppConfig
 from ..utils.credential_manager import CredentialManager
+from ..utils.file_utils import ensure_directory
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +25,9 @@ class SettingsStorageManager:
     4. Defaults - Hardcoded application defaults
     """
     
-    def __init__(self, user_id: str = "default"):
+    def __init__(self, user_id: str = "default", config_manager: Optional[ConfigManager] = None):
         self.user_id = user_id
-        self.config_manager = ConfigManager()
+        self.config_manager = config_manager or ConfigManager()
         self.credential_manager = CredentialManager()
         
         # Storage paths
@@ -211,9 +212,15 @@ class SettingsStorageManager:
                     
                     if hasattr(base_config, section):
                         section_obj = getattr(base_config, section)
-                        for key, value in section_settings.items():
-                            if hasattr(section_obj, key):
-                                setattr(section_obj, key, value)
+                        updates = {
+                            key: value for key, value in section_settings.items()
+                            if hasattr(section_obj, key)
+                        }
+                        # Config objects are immutable - swap in an updated copy
+                        if updates:
+                            self.config_manager.config = replace(
+                                base_config, **{section: replace(section_obj, **updates)}
+                            )
                     
                     self.config_manager.save_config()
                     
@@ -269,7 +276,7 @@ class SettingsStorageManager:
         """Load user settings from file"""
         try:
             if self.user_settings_file.exists():
-                with open(self.user_settings_file, 'r') as f:
+                with open(self.user_settings_file, 'rb') as f:
                     self._user_settings = json.load(f)
             else:
                 self._user_settings = {}
@@ -281,7 +288,7 @@ class SettingsStorageManager:
         """Load runtime settings from file"""
         try:
             if self.runtime_settings_file.exists():
-                with open(self.runtime_settings_file, 'r') as f:
+                with open(self.runtime_settings_file, 'rb') as f:
                     self._runtime_settings = json.load(f)
             else:
                 self._runtime_settings = {}
@@ -292,7 +299,7 @@ class SettingsStorageManager:
     def _save_user_settings(self):
         """Save user settings to file"""
         try:
-            self.user_settings_file.parent.mkdir(parents=True, exist_ok=True)
+            ensure_directory(self.user_settings_file.parent)
             with open(self.user_settings_file, 'w') as f:
                 json.dump(self._user_settings, f, indent=2)
         except Exception as e:
@@ -301,7 +308,7 @@ class SettingsStorageManager:
     def _save_runtime_settings(self):
         """Save runtime settings to file"""
         try:
-            self.runtime_settings_file.parent.mkdir(parents=True, exist_ok=True)
+            ensure_directory(self.runtime_settings_file.parent)
             with open(self.runtime_settings_file, 'w') as f:
                 json.dump(self._runtime_settings, f, indent=2)
         except Exception as e:
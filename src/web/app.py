@@ -3,6 +3,7 @@ FastAPI Web Application for Easy Torrent Creator
 Provides REST API for settings management, torrent creation, and monitoring
 """
 import os
+import json
 import asyncio
 import uuid
 from typing import Dict, Any, Optional, List
@@ -14,12 +15,14 @@ from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel
 
 # Import our application modules
 import sys
-sys.path.append(str(Path(__file__).parent.parent.parent))
+_APP_DIR = str(Path(__file__).parent.parent.parent)
+if _APP_DIR not in sys.path:
+    sys.path.append(_APP_DIR)
 
 from src.core.config_manager import ConfigManager, AppConfig
 from src.core.torrent_manager import TorrentManager
@@ -51,13 +54,14 @@ async def lifespan(app: FastAPI):
     
     try:
         # Initialize configuration managers
+        # One ConfigManager is shared so the config file is parsed once
         config_manager = ConfigManager()
-        secure_config_manager = SecureConfigManager()
-        settings_storage = SettingsStorageManager()
+        secure_config_manager = SecureConfigManager(config_manager=config_manager)
+        settings_storage = SettingsStorageManager(config_manager=config_manager)
         
         # Initialize torrent manager
-        config = config_manager.load_config()
-        torrent_manager = TorrentManager(config, config_manager)
+        config = config_manager.get_config()
+        torrent_manager = TorrentManager.get_shared(config, config_manager)
         
         logger.info("✅ Application managers initialized successfully")
         
@@ -304,6 +308,8 @@ async def store_credential(request: CredentialRequest):
         success = secure_config_manager.store_secure_value(request.key, request.value)
         
         if success:
+            if torrent_manager:
+                torrent_manager.clear_credential_cache()
             return {
                 "success": True,
                 "message": f"Credential '{request.key}' stored securely"
@@ -323,6 +329,8 @@ async def delete_credential(key: str):
         success = credential_manager.delete_credential(key)
         
         if success:
+            if torrent_manager:
+                torrent_manager.clear_credential_cache()
             return {
                 "success": True,
                 "message": f"Credential '{key}' deleted"
@@ -392,8 +400,6 @@ async def get_torrent_status(task_id: str):
 async def download_torrent_file(task_id: str):
     """Download the created torrent file"""
     try:
-        from fastapi.responses import Response
-        
         # Get torrent file bytes from TorrentManager
         torrent_bytes = await torrent_manager.get_torrent_file_bytes(task_id)
         
@@ -449,7 +455,6 @@ async def get_user_preferences(user_id: str = "default"):
         prefs_file = Path(f"config/user_preferences_{user_id}.json")
         
         if prefs_file.exists():
-            import json
             with open(prefs_file, 'r') as f:
                 return json.load(f)
         else:
@@ -469,7 +474,6 @@ async def save_user_preference(request: UserPreference):
         # Load existing preferences
         preferences = {}
         if prefs_file.exists():
-            import json
             with open(prefs_file, 'r') as f:
                 preferences = json.load(f)
         
@@ -477,7 +481,6 @@ async def save_user_preference(request: UserPreference):
         preferences[request.key] = request.value
         
         # Save back to file
-        import json
         with open(prefs_file, 'w') as f:
             json.dump(preferences, f, indent=2)
         
@@ -499,16 +502,17 @@ async def refresh_torrent_manager():
     global torrent_manager
     
     try:
-        # Clean up existing manager
-        if torrent_manager:
-            await torrent_manager.cleanup()
-        
         # Get effective settings and create config object
         effective_settings = settings_storage.get_effective_settings()
         config = AppConfig.from_dict(effective_settings)
         
-        # Create new manager with updated config
-        torrent_manager = TorrentManager(config, config_manager)
+        # Get the manager for the updated config; it may be the current one
+        previous_manager = torrent_manager
+        torrent_manager = TorrentManager.get_shared(config, config_manager)
+        
+        # Only log out a manager that has actually been replaced
+        if previous_manager is not None and previous_manager is not torrent_manager:
+            await previous_manager.cleanup()
         
         logger.info("✅ Torrent manager refreshed with new settings")
         
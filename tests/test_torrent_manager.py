@@ -0,0 +1,33 @@
+"""
+Tests for qBittorrent version parsing in the torrent manager
+"""
+import pytest
+
+pytest.importorskip("qbittorrentapi")
+
+from src.core.torrent_manager import _parse_qbit_version
+
+
+@pytest.mark.parametrize("version, expected", [
+    ("v5.0.0", (5, 0)),
+    ("5.1.2", (5, 1)),
+    ("v4.6.7", (4, 6)),
+    ("  v5.0.1\n", (5, 0)),
+    ("5", (5, 0)),
+])
+def test_parse_release_versions(version, expected):
+    assert _parse_qbit_version(version) == expected
+
+
+@pytest.mark.parametrize("version, expected", [
+    ("v5.0.0beta1", (5, 0)),
+    ("5.1.0rc2", (5, 1)),
+    ("v5.0.0.10", (5, 0)),
+])
+def test_parse_suffixed_builds(version, expected):
+    assert _parse_qbit_version(version) == expected
+
+
+@pytest.mark.parametrize("version", ["", "   ", "garbage", "vX.Y", "unknown 5.0"])
+def test_parse_garbage(version):
+    assert _parse_qbit_version(version) == (0, 0)